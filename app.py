@@ -1,10 +1,6 @@
 from app import create_app
-from app.models.database import db
 
 app = create_app()
 
 if __name__ == "__main__":
-  with app.app_context():
-    db.create_all()
-
   app.run(host="0.0.0.0", port=3000, debug=True)
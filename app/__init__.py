@@ -2,8 +2,17 @@ from flask import redirect
 from flask_cors import CORS
 from flask_openapi3 import Info, OpenAPI, Tag
 
+from app.commands import register_commands
+from app.lib.redirect_fast_path import RedirectFastPath
 from app.lib.validation_error_handler import validation_error_handler
 from app.models.database import init_db
+from app.services.click_aggregator import click_aggregator
+from app.services.scrape_jobs import scrape_workers
+from app.services.shortener import (
+  BUFFER_CLICKS,
+  REDIRECT_FAST_PATH,
+  URLShortenerService,
+)
 
 
 def create_app():
@@ -22,6 +31,11 @@ def create_app():
 
   CORS(app)
   init_db(app)
+  click_aggregator.init_app(app, URLShortenerService().record_clicks)
+  register_commands(app)
+
+  # Started on the first request rather than here, so CLI commands and pre-fork masters don't run workers.
+  app.before_request(lambda: scrape_workers.ensure_started(app))
 
   home_tag = Tag(name="Documentação", description="Seleção de documentação: Swagger, Redoc ou RapiDoc")
 
@@ -40,6 +54,21 @@ def create_app():
   from app.routes.shortener import shorteners_bp
   app.register_api(shorteners_bp)
 
+  from app.routes.metrics import metrics_bp
+  app.register_api(metrics_bp)
+
+  # Without the click buffer every redirect writes to the database, which needs the Flask app context.
+  if REDIRECT_FAST_PATH and BUFFER_CLICKS:
+    shorten_service = URLShortenerService()
+    app.wsgi_app = RedirectFastPath(
+      app.wsgi_app,
+      '/nos/',
+      shorten_service.cached_original_url,
+      shorten_service.track_access,
+      # What CORS(app) adds, with its default settings, to requests without an Origin.
+      headers=[('Access-Control-Allow-Origin', '*')],
+    )
+
   return app
 
 
@@ -0,0 +1,9 @@
+def register_commands(app):
+  from app.commands.analytics import analytics_cli
+  from app.commands.db import db_cli
+  from app.commands.jobs import jobs_cli
+  from app.commands.websites import websites_cli
+  app.cli.add_command(analytics_cli)
+  app.cli.add_command(db_cli)
+  app.cli.add_command(jobs_cli)
+  app.cli.add_command(websites_cli)
@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+import click
+from flask.cli import AppGroup
+
+from app.services.shortener import URLShortenerService
+
+analytics_cli = AppGroup('analytics', help='Manutenção dos dados de analytics do encurtador.')
+
+
+@analytics_cli.command('rollup')
+@click.option('--older-than-days', default=7, show_default=True, help='Compacta buckets horários mais antigos que N dias.')
+def rollup(older_than_days: int):
+  """Compacta os buckets horários de cliques em buckets diários."""
+  URLShortenerService().rollup_click_buckets(timedelta(days=older_than_days))
+  click.echo('Buckets de cliques compactados.')
@@ -0,0 +1,40 @@
+import click
+from flask.cli import AppGroup
+
+from app.models.database import create_schema, seed_websites
+from app.services.query_plans import check_query_plans
+
+db_cli = AppGroup('db', help='Criação e carga inicial do banco de dados.')
+
+
+@db_cli.command('init')
+def init():
+  """Cria o banco de dados e as tabelas que ainda não existem."""
+  if create_schema():
+    click.echo('Banco de dados criado.')
+  click.echo('Tabelas criadas.')
+
+
+@db_cli.command('seed')
+def seed():
+  """Carrega os sites iniciais quando a tabela de sites está vazia."""
+  inserted = seed_websites()
+  if inserted:
+    click.echo(f'{inserted} site(s) inicial(is) carregado(s).')
+  else:
+    click.echo('Tabela de sites já possui dados, nada a carregar.')
+
+
+@db_cli.command('explain')
+def explain():
+  """Confere com EXPLAIN que as consultas frequentes usam índices.
+
+  Termina com código 1 se alguma delas ler uma tabela ou um índice inteiro.
+  """
+  results = check_query_plans()
+  for name, scans in results.items():
+    status = 'ok' if not scans else ', '.join(scans)
+    click.echo(f'{name}: {status}')
+
+  if any(results.values()):
+    raise SystemExit(1)
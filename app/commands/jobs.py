@@ -0,0 +1,20 @@
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.services.scrape_jobs import ScrapeWorkerPool
+
+jobs_cli = AppGroup('jobs', help='Processamento dos jobs de pré-cadastro.')
+
+
+@jobs_cli.command('work')
+@click.option('--workers', default=2, show_default=True, help='Quantidade de threads processando a fila.')
+@click.option('--poll-interval', default=1.0, show_default=True, help='Segundos entre consultas quando a fila está vazia.')
+def work(workers: int, poll_interval: float):
+  """Processa a fila de pré-cadastro em um processo dedicado."""
+  app = current_app._get_current_object()
+  pool = ScrapeWorkerPool(workers=workers, poll_interval=poll_interval)
+  pool.ensure_started(app)
+  click.echo(f'{workers} worker(s) processando a fila de pré-cadastro.')
+
+  pool.join()
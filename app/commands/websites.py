@@ -0,0 +1,21 @@
+import click
+from flask.cli import AppGroup
+
+from app.services.crawler import WebsiteCrawler
+from app.services.shortener import URLShortenerService
+from app.services.website import WebsiteService
+
+websites_cli = AppGroup('websites', help='Manutenção dos sites do webring.')
+
+
+@websites_cli.command('refresh')
+@click.option('--concurrency', default=8, show_default=True, help='Quantidade de sites acessados em paralelo.')
+@click.option('--host-delay', default=1.0, show_default=True, help='Segundos entre requisições ao mesmo host.')
+def refresh(concurrency: int, host_delay: float):
+  """Atualiza os metadados dos sites aprovados e registra a saúde dos links."""
+  crawler = WebsiteCrawler(WebsiteService(URLShortenerService()), concurrency=concurrency, host_delay=host_delay)
+  summary = crawler.run()
+
+  click.echo(f"{summary['checked']} site(s) verificados, {summary['updated']} atualizado(s).")
+  if summary['unhealthy']:
+    click.echo(f"Sites com falha: {', '.join(map(str, summary['unhealthy']))}")
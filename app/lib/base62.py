@@ -1,20 +1,50 @@
 import string
 
 CHARS = string.ascii_lowercase + string.ascii_uppercase + string.digits
+CHAR_VALUES = {char: value for value, char in enumerate(CHARS)}
+# Every two-digit code, so encoding takes one divmod per pair of digits.
+CHAR_PAIRS = [high + low for high in CHARS for low in CHARS]
+# Matches the String(11) short_url columns; 62 ** 11 covers any 64-bit id.
+MAX_CODE_LENGTH = 11
 
 def encode_base62(num: int) -> str:
-  if num == 0:
-    return CHARS[0]
+  if num < 62:
+    return CHARS[num]
 
   encoding = ""
-  while num > 0:
-    num, remainder = divmod(num, 62)
-    encoding = CHARS[remainder] + encoding
+  while num >= 3844:
+    num, remainder = divmod(num, 3844)
+    encoding = CHAR_PAIRS[remainder] + encoding
 
-  return encoding
+  return (CHAR_PAIRS[num] if num >= 62 else CHARS[num]) + encoding
+
+def try_decode_base62(short_url: str) -> int | None:
+  """Returns the number a code encodes, or None if no encode_base62 output looks like it.
+
+  Codes that are empty, longer than MAX_CODE_LENGTH, contain other characters
+  or start with a zero digit (an alias of the shorter code) are rejected
+  without scanning further.
+  """
+  if not 0 < len(short_url) <= MAX_CODE_LENGTH or (short_url[0] == CHARS[0] and len(short_url) > 1):
+    return None
 
-def decode_base62(short_url: str) -> int:
   num = 0
-  for char in short_url:
-    num = num * 62 + CHARS.index(char)
+  try:
+    for char in short_url:
+      num = num * 62 + CHAR_VALUES[char]
+  except KeyError:
+    return None
+  return num
+
+def decode_base62(short_url: str) -> int:
+  num = try_decode_base62(short_url)
+  if num is None:
+    raise ValueError(f"Código base62 inválido: {short_url!r}")
   return num
+
+def encode_base62_many(nums: list[int]) -> list[str]:
+  return [encode_base62(num) for num in nums]
+
+def decode_base62_many(short_urls: list[str]) -> list[int | None]:
+  """Decodes codes in input order; invalid ones become None instead of failing the batch."""
+  return [try_decode_base62(short_url) for short_url in short_urls]
@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import OrderedDict
+
+MISSING = object()
+
+
+class LRUCache:
+  """Thread-safe LRU cache with per-entry TTL and hit/miss counters."""
+
+  def __init__(self, max_size: int = 1024, ttl: float | None = None):
+    self.max_size = max_size
+    self.ttl = ttl
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self._entries: OrderedDict = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, key, default=MISSING, count_miss: bool = True):
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        if count_miss:
+          self.misses += 1
+        return default
+
+      value, expires_at = entry
+      if expires_at is not None and expires_at <= time.monotonic():
+        del self._entries[key]
+        if count_miss:
+          self.misses += 1
+        return default
+
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return value
+
+  def set(self, key, value, ttl: float | None = MISSING) -> None:
+    if self.max_size <= 0:
+      return
+
+    ttl = self.ttl if ttl is MISSING else ttl
+    expires_at = time.monotonic() + ttl if ttl is not None else None
+
+    with self._lock:
+      self._entries[key] = (value, expires_at)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_size:
+        self._entries.popitem(last=False)
+        self.evictions += 1
+
+  def delete(self, key) -> None:
+    with self._lock:
+      self._entries.pop(key, None)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+  def stats(self) -> dict:
+    with self._lock:
+      return {
+        "size": len(self._entries),
+        "max_size": self.max_size,
+        "hits": self.hits,
+        "misses": self.misses,
+        "evictions": self.evictions,
+      }
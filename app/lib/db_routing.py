@@ -0,0 +1,146 @@
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from flask_sqlalchemy import SignallingSession, SQLAlchemy
+from sqlalchemy import event, orm, text
+
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+
+
+@contextmanager
+def read_only():
+    """Lets queries inside the block go to a read replica, when one is configured."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def read_only_route(view):
+    """Decorator form of ``read_only`` for views that never write."""
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        with read_only():
+            return view(*args, **kwargs)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """Round-robin over the replica binds, skipping the ones failing health checks.
+
+    A replica is pinged at most once per ``check_interval`` seconds. One that
+    fails a ping or drops a connection is left out for ``retry_after`` seconds,
+    and reads fall back to the primary while no replica is available.
+    """
+
+    def __init__(self, check_interval: float = 10.0, retry_after: float = 30.0):
+        self.check_interval = check_interval
+        self.retry_after = retry_after
+        self.bind_keys: list[str] = []
+        self._next = 0
+        self._checked_at: dict[str, float] = {}
+        self._down_until: dict[str, float] = {}
+        self._watched: set[int] = set()
+        self._lock = threading.Lock()
+
+    def init_app(self, bind_keys: list[str]) -> None:
+        self.bind_keys = list(bind_keys)
+
+    def pick(self, db: SQLAlchemy, app):
+        """Returns the engine of the next healthy replica, or None."""
+        with self._lock:
+            keys = self.bind_keys[self._next:] + self.bind_keys[: self._next]
+            self._next = (self._next + 1) % len(self.bind_keys) if self.bind_keys else 0
+
+        for key in keys:
+            engine = db.get_engine(app, bind=key)
+            if self._is_healthy(key, engine):
+                return engine
+        return None
+
+    def status(self) -> dict[str, bool]:
+        now = time.monotonic()
+        with self._lock:
+            return {key: self._down_until.get(key, 0) <= now for key in self.bind_keys}
+
+    def _is_healthy(self, key: str, engine) -> bool:
+        self._watch(key, engine)
+        now = time.monotonic()
+        with self._lock:
+            if self._down_until.get(key, 0) > now:
+                return False
+            if now - self._checked_at.get(key, float("-inf")) < self.check_interval:
+                return True
+            self._checked_at[key] = now
+
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            self._mark_down(key)
+            return False
+
+    def _watch(self, key: str, engine) -> None:
+        if id(engine) in self._watched:
+            return
+        self._watched.add(id(engine))
+
+        def on_error(context):
+            if context.is_disconnect:
+                self._mark_down(key)
+
+        event.listen(engine, "handle_error", on_error)
+
+    def _mark_down(self, key: str) -> None:
+        with self._lock:
+            self._down_until[key] = time.monotonic() + self.retry_after
+
+
+class RoutingSession(SignallingSession):
+    """Session that sends reads inside ``read_only`` to a replica.
+
+    Flushes, DML and locking reads always use the primary. Once the session has
+    written, later reads stay on the primary as well, so a request sees its own
+    writes regardless of replication lag.
+    """
+
+    def __init__(self, db, router: ReplicaRouter, **options):
+        self.router = router
+        self._db = db
+        self._wrote = False
+        super().__init__(db, **options)
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or _is_write(clause):
+            self._wrote = True
+        elif _read_only.get() and not self._wrote and self.router.bind_keys:
+            engine = self.router.pick(self._db, self.app)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper, clause)
+
+    def close(self):
+        self._wrote = False
+        super().close()
+
+
+def _is_write(clause) -> bool:
+    if clause is None:
+        return False
+    return getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    def __init__(self, *args, router: ReplicaRouter | None = None, **kwargs):
+        self.router = router or ReplicaRouter()
+        super().__init__(*args, **kwargs)
+
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, router=self.router, **options)
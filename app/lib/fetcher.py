@@ -0,0 +1,116 @@
+import codecs
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class FetchTimeoutError(Exception):
+    pass
+
+
+class UnsupportedContentError(Exception):
+    pass
+
+
+class Fetcher:
+    """Shared HTTP client used to scrape submitted websites.
+
+    Requests run on a thread pool over one pooled session, with a cap on
+    concurrent requests per host and an overall deadline per operation.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+        request_timeout: float = 5.0,
+        deadline: float = 8.0,
+    ):
+        self.per_host_limit = per_host_limit
+        self.request_timeout = request_timeout
+        self.default_deadline = deadline
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetcher")
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def deadline(self, seconds: float | None = None) -> float:
+        return time.monotonic() + (seconds or self.default_deadline)
+
+    def submit(self, url: str, deadline: float, method: str = "GET", **kwargs) -> Future:
+        return self._executor.submit(self.request, url, deadline, method, **kwargs)
+
+    def request(self, url: str, deadline: float, method: str = "GET", **kwargs) -> requests.Response:
+        slot = self._host_slot(urlsplit(url).hostname or "")
+        if not slot.acquire(timeout=max(deadline - time.monotonic(), 0)):
+            raise FetchTimeoutError(f"Tempo esgotado aguardando conexão com {url}")
+
+        try:
+            timeout = min(self.request_timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                raise FetchTimeoutError(f"Tempo esgotado ao acessar {url}")
+            return self.session.request(method, url, timeout=timeout, allow_redirects=True, **kwargs)
+        finally:
+            slot.release()
+
+    def result(self, future: Future, deadline: float) -> requests.Response:
+        """Waits for a submitted request without going past the deadline."""
+        try:
+            return future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            future.cancel()
+            raise FetchTimeoutError("Tempo esgotado ao acessar o site")
+
+    def iter_text(
+        self,
+        response: requests.Response,
+        deadline: float,
+        max_bytes: int,
+        accept: tuple[str, ...] = ("text/html", "application/xhtml+xml"),
+        chunk_size: int = 16384,
+    ) -> Iterator[str]:
+        """Decodes a streamed response incrementally, stopping at ``max_bytes``.
+
+        Rejects the response before reading the body if its Content-Type is not
+        one of ``accept``. Callers can stop iterating early to drop the rest of
+        the body.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and not any(kind in content_type for kind in accept):
+            raise UnsupportedContentError(f"Tipo de conteúdo não suportado: {content_type}")
+
+        encoding = response.encoding if "charset" in content_type else "utf-8"
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        received = 0
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if time.monotonic() > deadline:
+                raise FetchTimeoutError(f"Tempo esgotado ao ler {response.url}")
+
+            chunk = chunk[: max_bytes - received]
+            received += len(chunk)
+            yield decoder.decode(chunk)
+
+            if received >= max_bytes:
+                break
+
+        yield decoder.decode(b"", final=True)
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return slot
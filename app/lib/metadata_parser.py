@@ -0,0 +1,144 @@
+import re
+from html.parser import HTMLParser
+
+PRIMARY_COLOR_RE = re.compile(r"--primary-color\s*:\s*([^;]+);")
+INLINE_COLOR_RE = re.compile(r"color\s*:\s*([^;]+);")
+
+
+class _StopParsing(Exception):
+    pass
+
+
+class PageMetadataParser(HTMLParser):
+    """Collects everything the webring needs from a page in a single pass.
+
+    Title, meta tags, link rels, inline styles and the webring link are gathered
+    while the document streams through ``feed``. Parsing stops as soon as the
+    head is closed and, when ``webring_url`` is given, a link to it was seen.
+    """
+
+    def __init__(self, webring_url: str | None = None):
+        super().__init__(convert_charrefs=True)
+        self.webring_url = webring_url
+        self.title: str | None = None
+        self.metas: dict[tuple[str, str], str | None] = {}
+        self.icon_hrefs: list[str] = []
+        self.manifest_href: str | None = None
+        self.styles: list[str] = []
+        self.head_inline_styles: list[str] = []
+        self.has_webring_link = False
+        self.head_closed = False
+        self._in_head = False
+        self._title_parts: list[str] | None = None
+        self._style_parts: list[str] | None = None
+        self._stopped = False
+
+    def to_dict(self) -> dict:
+        return {
+            "webring_url": self.webring_url,
+            "title": self.title,
+            "metas": [[attr, value, content] for (attr, value), content in self.metas.items()],
+            "icon_hrefs": self.icon_hrefs,
+            "manifest_href": self.manifest_href,
+            "styles": self.styles,
+            "head_inline_styles": self.head_inline_styles,
+            "has_webring_link": self.has_webring_link,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PageMetadataParser":
+        parser = cls(data["webring_url"])
+        parser.title = data["title"]
+        parser.metas = {(attr, value): content for attr, value, content in data["metas"]}
+        parser.icon_hrefs = data["icon_hrefs"]
+        parser.manifest_href = data["manifest_href"]
+        parser.styles = data["styles"]
+        parser.head_inline_styles = data["head_inline_styles"]
+        parser.has_webring_link = data["has_webring_link"]
+        parser.head_closed = True
+        parser._stopped = True
+        return parser
+
+    @property
+    def done(self) -> bool:
+        return self.head_closed and (self.webring_url is None or self.has_webring_link)
+
+    def feed(self, data: str) -> None:
+        if self._stopped:
+            return
+        try:
+            super().feed(data)
+        except _StopParsing:
+            self._stopped = True
+
+    def close(self) -> None:
+        if self._stopped:
+            return
+        try:
+            super().close()
+        except _StopParsing:
+            self._stopped = True
+
+    def meta_content(self, attr: str, value: str) -> str | None:
+        return self.metas.get((attr, value))
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+
+        if tag == "head":
+            self._in_head = True
+        elif tag == "body":
+            self._close_head()
+        elif tag == "title" and self.title is None:
+            self._title_parts = []
+        elif tag == "style":
+            self._style_parts = []
+        elif tag == "meta":
+            for attr in ("name", "property"):
+                if attrs.get(attr):
+                    self.metas.setdefault((attr, attrs[attr]), attrs.get("content"))
+        elif tag == "link":
+            self._handle_link(attrs)
+        elif tag == "a":
+            href = attrs.get("href")
+            if self.webring_url is not None and href is not None and self.webring_url in href:
+                self.has_webring_link = True
+                self._stop_if_done()
+
+        if self._in_head and attrs.get("style"):
+            self.head_inline_styles.append(attrs["style"])
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts).strip() or None
+            self._title_parts = None
+        elif tag == "style" and self._style_parts is not None:
+            self.styles.append("".join(self._style_parts))
+            self._style_parts = None
+        elif tag == "head":
+            self._close_head()
+
+    def handle_data(self, data):
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        elif self._style_parts is not None:
+            self._style_parts.append(data)
+
+    def _handle_link(self, attrs: dict) -> None:
+        rels = (attrs.get("rel") or "").split()
+        href = attrs.get("href")
+        if not href:
+            return
+        if "manifest" in rels and self.manifest_href is None:
+            self.manifest_href = href
+        if any("icon" in rel for rel in rels):
+            self.icon_hrefs.append(href)
+
+    def _close_head(self) -> None:
+        self._in_head = False
+        self.head_closed = True
+        self._stop_if_done()
+
+    def _stop_if_done(self) -> None:
+        if self.done:
+            raise _StopParsing()
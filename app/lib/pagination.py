@@ -0,0 +1,93 @@
+import base64
+import binascii
+import json
+
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursorError(ValueError):
+  pass
+
+
+def encode_cursor(value) -> str:
+  raw = json.dumps(value, separators=(',', ':')).encode()
+  return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str):
+  value = _load_cursor(cursor)
+  if isinstance(value, bool) or not isinstance(value, (int, str)):
+    raise InvalidCursorError('Cursor inválido')
+  return value
+
+
+def decode_ranked_cursor(cursor: str) -> tuple[float, int | str]:
+  value = _load_cursor(cursor)
+  if (
+    not isinstance(value, list)
+    or len(value) != 2
+    or isinstance(value[0], bool)
+    or not isinstance(value[0], (int, float))
+    or isinstance(value[1], bool)
+    or not isinstance(value[1], (int, str))
+  ):
+    raise InvalidCursorError('Cursor inválido')
+  return value[0], value[1]
+
+
+def _check_key(value, key_column):
+  # Comparing a column with a value of another type fails in the database instead of here.
+  if not isinstance(value, key_column.type.python_type) or (isinstance(value, str) and '\x00' in value):
+    raise InvalidCursorError('Cursor inválido')
+  return value
+
+
+def _load_cursor(cursor: str):
+  try:
+    padded = cursor + '=' * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+  except (binascii.Error, UnicodeDecodeError, ValueError):
+    raise InvalidCursorError('Cursor inválido')
+
+
+def paginate(query, key_column, limit: int | None = None, after: str | None = None):
+  """Keyset pagination over a unique, ordered column.
+
+  Returns the page items and the cursor for the next page, or None on the last page.
+  """
+  limit = min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+  if after:
+    query = query.filter(key_column > _check_key(decode_cursor(after), key_column))
+
+  items = query.order_by(key_column).limit(limit + 1).all()
+  if len(items) <= limit:
+    return items, None
+
+  items = items[:limit]
+  return items, encode_cursor(getattr(items[-1], key_column.key))
+
+
+def paginate_ranked(query, score, key_column, limit: int | None = None, after: str | None = None):
+  """Keyset pagination by descending ``score``, ties broken by a unique column.
+
+  ``query`` must select the entity and ``score``. Returns the entities of the
+  page and the cursor for the next page, or None on the last page.
+  """
+  limit = min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+  if after:
+    last_score, last_key = decode_ranked_cursor(after)
+    _check_key(last_key, key_column)
+    query = query.filter(or_(score < last_score, and_(score == last_score, key_column > last_key)))
+
+  rows = query.order_by(score.desc(), key_column).limit(limit + 1).all()
+  items = [item for item, _ in rows[:limit]]
+  if len(rows) <= limit:
+    return items, None
+
+  last_item, last_score = rows[limit - 1]
+  return items, encode_cursor([last_score, getattr(last_item, key_column.key)])
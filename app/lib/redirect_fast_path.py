@@ -0,0 +1,65 @@
+import html
+from typing import Callable
+
+from werkzeug.urls import iri_to_uri
+
+
+class RedirectFastPath:
+  """WSGI middleware that answers cached short URL redirects before Flask sees them.
+
+  A GET or HEAD to ``<prefix><code>`` whose original URL ``lookup`` already
+  knows gets its 302 straight from here, after ``on_hit`` records the click.
+  Everything else, including cache misses, unknown codes and cross-origin
+  requests, goes to the wrapped application unchanged. ``headers`` are added
+  to every redirect, for what the application's after-request hooks would
+  have set on a same-origin request.
+  """
+
+  def __init__(
+    self,
+    wsgi_app,
+    prefix: str,
+    lookup: Callable[[str], str | None],
+    on_hit: Callable[[str], None],
+    headers: list[tuple[str, str]] | None = None,
+  ):
+    self.wsgi_app = wsgi_app
+    self.prefix = prefix
+    self.lookup = lookup
+    self.on_hit = on_hit
+    self.headers = headers or []
+
+  def __call__(self, environ, start_response):
+    path = environ.get("PATH_INFO", "")
+    if (
+      path.startswith(self.prefix)
+      and environ["REQUEST_METHOD"] in ("GET", "HEAD")
+      # CORS responses echo the Origin back, so they are left to flask-cors.
+      and "HTTP_ORIGIN" not in environ
+    ):
+      short_url = path[len(self.prefix):]
+      original_url = self.lookup(short_url) if short_url and "/" not in short_url else None
+      if original_url:
+        self.on_hit(short_url)
+        return self._redirect(original_url, environ, start_response)
+
+    return self.wsgi_app(environ, start_response)
+
+  def _redirect(self, original_url: str, environ, start_response):
+    # Same status, Location and body as flask.redirect, without building a Response object.
+    location = iri_to_uri(original_url, safe_conversion=True)
+    body = (
+      '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 3.2 Final//EN">\n'
+      "<title>Redirecting...</title>\n"
+      "<h1>Redirecting...</h1>\n"
+      "<p>You should be redirected automatically to target URL: "
+      f'<a href="{html.escape(location)}">{html.escape(original_url)}</a>. If'
+      " not click the link."
+    ).encode()
+    start_response("302 FOUND", [
+      ("Content-Type", "text/html; charset=utf-8"),
+      ("Content-Length", str(len(body))),
+      ("Location", location),
+      *self.headers,
+    ])
+    return [] if environ["REQUEST_METHOD"] == "HEAD" else [body]
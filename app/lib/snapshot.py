@@ -0,0 +1,81 @@
+import gzip
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from flask import Response, json, request
+
+
+@dataclass
+class Snapshot:
+    version: int
+    body: bytes
+    gzipped: bytes
+    etag: str
+    # Strong validators must differ between content-codings (RFC 7232, section 2.1).
+    gzip_etag: str
+    built_at: float = field(default_factory=time.monotonic)
+
+
+class SnapshotStore:
+    """Keeps pre-encoded JSON payloads in memory until they are invalidated.
+
+    Snapshots are rebuilt lazily on the next read after invalidate(), or once
+    they are older than ``ttl`` seconds so other workers' writes show up too.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        self.ttl = ttl
+        self._version = 0
+        self._snapshots: dict[str, Snapshot] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, builder: Callable[[], Any]) -> Snapshot:
+        snapshot = self._snapshots.get(name)
+        if snapshot and not self._expired(snapshot):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshots.get(name)
+            if snapshot and not self._expired(snapshot):
+                return snapshot
+
+            body = json.dumps(builder()).encode("utf-8")
+            etag = hashlib.sha256(body).hexdigest()[:32]
+            snapshot = Snapshot(
+                version=self._version,
+                body=body,
+                gzipped=gzip.compress(body),
+                etag=etag,
+                gzip_etag=f"{etag}-gz",
+            )
+            self._snapshots[name] = snapshot
+            return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._snapshots.clear()
+
+    def _expired(self, snapshot: Snapshot) -> bool:
+        return self.ttl is not None and time.monotonic() - snapshot.built_at > self.ttl
+
+
+def snapshot_response(snapshot: Snapshot) -> Response:
+    """Serves a snapshot as-is, answering 304 when the client already has it."""
+    gzipped = "gzip" in request.accept_encodings
+    etag = snapshot.gzip_etag if gzipped else snapshot.etag
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    elif gzipped:
+        response = Response(snapshot.gzipped, mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(snapshot.body, mimetype="application/json")
+
+    response.set_etag(etag)
+    response.vary.add("Accept-Encoding")
+    return response
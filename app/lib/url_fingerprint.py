@@ -0,0 +1,28 @@
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_PORTS = {'http': 80, 'https': 443, 'ftp': 21}
+
+
+def normalize_url(url: str) -> str:
+  """Lowercases scheme and host and drops the default port; path, query and fragment are kept as is."""
+  parts = urlsplit(url.strip())
+  scheme = parts.scheme.lower()
+  host = (parts.hostname or '').lower()
+  if ':' in host:
+    host = f'[{host}]'
+
+  try:
+    port = parts.port
+  except ValueError:
+    port = None
+  if port is not None and port != DEFAULT_PORTS.get(scheme):
+    host = f'{host}:{port}'
+
+  userinfo = parts.netloc.rpartition('@')[0]
+  netloc = f'{userinfo}@{host}' if userinfo else host
+  return urlunsplit((scheme, netloc, parts.path or '/', parts.query, parts.fragment))
+
+
+def url_fingerprint(url: str) -> str:
+  return hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
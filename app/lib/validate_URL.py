@@ -1,11 +1,12 @@
 import re
 
+URL_REGEX = re.compile(
+  r'^(?:http|ftp)s?://'
+  r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'
+  r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+  r'(?::\d+)?'
+  r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 
 def validate_URL(url: str) -> bool:
-  regex = re.compile(
-    r'^(?:http|ftp)s?://'
-    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'
-    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-    r'(?::\d+)?'
-    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-  return re.match(regex, url) is not None
+  return URL_REGEX.match(url) is not None
@@ -0,0 +1,20 @@
+from app.models.database import db
+
+HOUR = 'hour'
+DAY = 'day'
+
+
+class URLClickBucket(db.Model):
+  __tablename__ = 'url_click_buckets'
+  __table_args__ = (
+    db.Index('ix_url_click_buckets_short_url_bucket_start', 'short_url', 'bucket_start'),
+    db.Index('ix_url_click_buckets_granularity_bucket_start', 'granularity', 'bucket_start'),
+  )
+
+  short_url: str = db.Column(db.String(11), db.ForeignKey('url_mappings.short_url'), primary_key=True)
+  granularity: str = db.Column(db.String(4), primary_key=True)
+  bucket_start = db.Column(db.DateTime, primary_key=True)
+  click_count: int = db.Column(db.Integer, default=0, nullable=False)
+
+  def __repr__(self):
+    return f'<URLClickBucket {self.short_url} {self.granularity} {self.bucket_start}>'
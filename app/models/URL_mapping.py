@@ -9,7 +9,9 @@ class URLMapping(db.Model):
   id: int = db.Column(db.Integer, primary_key=True, autoincrement=True)
   short_url: str = db.Column(db.String(11), unique=True, nullable=False )
   original_url: str = db.Column(db.Text, nullable=False)
-  created_at: datetime = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+  # sha256 of the normalized original_url; NULL only for duplicates created before it existed.
+  url_fingerprint: str = db.Column(db.String(64), unique=True, nullable=True)
+  created_at: datetime = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
 
   def __repr__(self):
     return f'<URLMapping {self.short_url}>'
@@ -1,6 +1,11 @@
 from .database import db as db
+from .fetch_cache import FetchCacheEntry as FetchCacheEntry
 from .keyword import Keyword as Keyword
 from .pre_website import PreWebsite as PreWebsite
+from .scrape_job import ScrapeJob as ScrapeJob
+from .table_change import TableChange as TableChange
 from .URL_analytics import URLAnalytics as URLAnalytics
+from .URL_click_bucket import URLClickBucket as URLClickBucket
 from .URL_mapping import URLMapping as URLMapping
 from .website import Website as Website
+from .website_health import WebsiteHealth as WebsiteHealth
@@ -1,10 +1,19 @@
+import json
 import os
+from datetime import datetime
 
-from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy_utils import create_database, database_exists
 
-db = SQLAlchemy()
+from app.lib.db_pool import MeteredQueuePool
+from app.lib.db_routing import ReplicaRouter, RoutingSQLAlchemy
+
+db = RoutingSQLAlchemy(
+    router=ReplicaRouter(
+        check_interval=float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "10")),
+        retry_after=float(os.getenv("DB_REPLICA_RETRY_AFTER", "30")),
+    )
+)
 
 basedir = os.path.abspath(os.path.dirname(__file__))
 
@@ -14,43 +23,109 @@ DB_HOST = os.getenv("POSTGRES_HOST")
 DB_PORT = os.getenv("POSTGRES_PORT")
 DB_NAME = os.getenv("POSTGRES_DB")
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# Comma-separated read replicas; reads inside read_only() are balanced between them.
+REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true") == "true"
+STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+APPLICATION_NAME = os.getenv("DB_APPLICATION_NAME", "nos-no-cabo-server")
+# PgBouncer in transaction mode rejects startup options and shares server sessions between clients.
+PGBOUNCER = os.getenv("DB_PGBOUNCER", "false") == "true"
+
+INITIAL_WEBSITES_PATH = os.path.join(basedir, '..', 'data', 'initial_websites.json')
 
 def init_db(app):
     """
-    Initializes the database connection for the Flask app.
-    Also loads initial data from initial_websites.json if the table is empty.
+    Binds the database to the Flask app without touching it.
+    Schema creation and seeding are one-shot steps, see `flask db init` and `flask db seed`.
     """
     app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(DATABASE_URL)
+    app.config["SQLALCHEMY_BINDS"] = {f"replica_{index}": url for index, url in enumerate(REPLICA_URLS)}
     db.init_app(app)
+    db.router.init_app(list(app.config["SQLALCHEMY_BINDS"]))
+
+    if PGBOUNCER and STATEMENT_TIMEOUT_MS and DATABASE_URL.startswith("postgresql"):
+        # SET LOCAL only lasts for the transaction, so it never leaks to another client's server session.
+        for bind in [None, *app.config["SQLALCHEMY_BINDS"]]:
+            event.listen(db.get_engine(app, bind=bind), "begin", _set_local_statement_timeout)
+
+def engine_options(url: str) -> dict:
+    """
+    Pool and connection settings for the Postgres engine, read from DB_* env vars.
+    Other databases keep SQLAlchemy's defaults.
+    """
+    if not url.startswith("postgresql"):
+        return {}
+
+    connect_args = {"application_name": APPLICATION_NAME}
+    if STATEMENT_TIMEOUT_MS and not PGBOUNCER:
+        connect_args["options"] = f"-c statement_timeout={STATEMENT_TIMEOUT_MS}"
+
+    return {
+        "poolclass": MeteredQueuePool,
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "pool_timeout": POOL_TIMEOUT,
+        "pool_recycle": POOL_RECYCLE,
+        "pool_pre_ping": POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+def _set_local_statement_timeout(conn):
+    conn.exec_driver_sql(f"SET LOCAL statement_timeout = {STATEMENT_TIMEOUT_MS}")
 
+def fits_column(column, value: str | None) -> bool:
+    """Whether ``value`` can be stored in the string ``column`` without Postgres rejecting the row."""
+    return value is None or len(value) <= column.type.length
+
+def create_schema() -> bool:
+    """
+    Creates the database if it does not exist, then any missing tables.
+    Returns whether the database had to be created.
+    """
     engine = create_engine(DATABASE_URL)
-    if not database_exists(engine.url):
+    created = not database_exists(engine.url)
+    if created:
         create_database(engine.url)
-        print("Database 'database.db' created.")
-    else:
-        print("Database loaded.")
-
-    with app.app_context():
-        db.create_all()
-        from app.models.website import Website
-        if Website.query.count() == 0:
-            import json
-            initial_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'initial_websites.json')
-            with open(initial_path, encoding='utf-8') as f:
-                Websites = json.load(f)
-                from datetime import datetime
-                for proj in Websites:
-                    p = Website(
-                        name=proj['name'],
-                        url=proj['url'],
-                        description=proj['description'],
-                        color=proj['color'],
-                        createdAt=datetime.utcnow(),
-                        updatedAt=datetime.utcnow(),
-                        faviconUrl=proj['faviconUrl'],
-                        repo=proj['repo']
-                    )
-                    db.session.add(p)
-                db.session.commit()
-            print("Initial Websites loaded into the database.")
+    engine.dispose()
+
+    db.create_all(bind=None)
+    return created
+
+def seed_websites() -> int:
+    """
+    Loads initial_websites.json into an empty website table with a single executemany.
+    Returns the number of inserted rows.
+    """
+    from app.models.website import Website
+
+    if db.session.query(Website.id).first() is not None:
+        return 0
+
+    with open(INITIAL_WEBSITES_PATH, encoding='utf-8') as f:
+        websites = json.load(f)
+
+    now = datetime.utcnow().isoformat()
+    rows = [
+        {
+            'name': proj['name'],
+            'url': proj['url'],
+            'description': proj['description'],
+            'color': proj['color'],
+            'createdAt': now,
+            'updatedAt': now,
+            'faviconUrl': proj['faviconUrl'],
+            'repo': proj['repo'],
+        }
+        for proj in websites
+    ]
+    if rows:
+        db.session.execute(Website.__table__.insert(), rows)
+    db.session.commit()
+    return len(rows)
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from app.models.database import db
+
+
+class FetchCacheEntry(db.Model):
+    __tablename__ = "fetch_cache"
+
+    url = db.Column(db.String(2048), primary_key=True)
+    etag = db.Column(db.String(300), nullable=True)
+    last_modified = db.Column(db.String(100), nullable=True)
+    body_digest = db.Column(db.String(64), nullable=False)
+    payload = db.Column(db.JSON, nullable=False)
+    size = db.Column(db.Integer, nullable=False, default=0)
+    fetched_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<FetchCacheEntry {self.url}>"
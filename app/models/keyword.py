@@ -6,7 +6,7 @@ class Keyword(db.Model):
 
   id: int = db.Column(db.Integer, primary_key=True, autoincrement=True)
   createdAt: str = db.Column(db.String(50), nullable=False)
-  updatedAt: str = db.Column(db.String(50), nullable=False)
+  updatedAt: str = db.Column(db.String(50), nullable=False, index=True)
   name: str = db.Column(db.String(100), nullable=False, unique=True)
 
   def __repr__(self):
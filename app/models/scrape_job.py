@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from app.models.database import db
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class ScrapeJob(db.Model):
+    __tablename__ = "scrape_job"
+    __table_args__ = (db.Index("ix_scrape_job_status_id", "status", "id"),)
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    url = db.Column(db.String(600), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default=PENDING)
+    error = db.Column(db.Text, nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    pre_website_id = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ScrapeJob {self.id} {self.status}>"
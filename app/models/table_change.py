@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from app.models.database import db
+
+
+class TableChange(db.Model):
+    """When rows were last deleted from a table, which no max(timestamp) can tell."""
+    __tablename__ = "table_changes"
+
+    table_name = db.Column(db.String(63), primary_key=True)
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<TableChange {self.table_name} {self.changed_at}>"
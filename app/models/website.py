@@ -1,13 +1,18 @@
 
 from datetime import datetime
 
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
 from app.models.database import db
 from app.models.website_base import WebsiteBase
 
+SEARCH_CONFIG = 'portuguese'
+
 website_keyword = db.Table(
     'website_keyword',
     db.Column('website_id', db.Integer, db.ForeignKey('website.id'), primary_key=True),
-    db.Column('keyword_id', db.Integer, db.ForeignKey('keyword.id'), primary_key=True)
+    db.Column('keyword_id', db.Integer, db.ForeignKey('keyword.id'), primary_key=True),
+    db.Index('ix_website_keyword_keyword_id', 'keyword_id'),
 )
 
 class Website(db.Model, WebsiteBase):
@@ -15,9 +20,22 @@ class Website(db.Model, WebsiteBase):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(300), nullable=False)
     description = db.Column(db.String(1000), nullable=False)
-    updatedAt = db.Column(db.String(50), nullable=False)
+    updatedAt = db.Column(db.String(50), nullable=False, index=True)
     repo = db.Column(db.String(400), nullable=True)
     keywords = db.relationship('Keyword', secondary=website_keyword, backref='websites')
+    # Kept up to date by Postgres on every insert and update; only loaded when a query asks for it.
+    search_vector = db.deferred(db.Column(
+        TSVECTOR,
+        db.Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+
+    __table_args__ = (
+        db.Index('ix_website_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     @classmethod
     def from_prewebsite(cls, prewebsite):
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from app.models.database import db
+
+
+class WebsiteHealth(db.Model):
+    __tablename__ = "website_health"
+
+    website_id = db.Column(
+        db.Integer, db.ForeignKey("website.id", ondelete="CASCADE"), primary_key=True
+    )
+    status_code = db.Column(db.Integer, nullable=True)
+    latency_ms = db.Column(db.Integer, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    healthy = db.Column(db.Boolean, nullable=False)
+    consecutive_failures = db.Column(db.Integer, nullable=False, default=0)
+    checked_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<WebsiteHealth {self.website_id} {self.status_code}>"
@@ -1,21 +1,27 @@
-from flask import jsonify
 from flask_openapi3 import APIBlueprint
 
+from app.lib.db_routing import read_only_route
+from app.lib.http_cache import cache_max_age, conditional_get
+from app.lib.snapshot import snapshot_response
 from app.lib.tags import keyword_tag
 from app.models.keyword import Keyword
 from app.schemas.error import ErrorSchema
 from app.schemas.keyword import KeywordSchema
+from app.services.shortener import URLShortenerService
+from app.services.website import WebsiteService
 
 keywords_bp = APIBlueprint('keywords', __name__, url_prefix = '/keywords')
+website_service = WebsiteService(URLShortenerService())
 
 @keywords_bp.get('/', tags=[keyword_tag], responses={"200": KeywordSchema, "500": ErrorSchema})
+@read_only_route
+@conditional_get(Keyword.updatedAt, max_age=cache_max_age("keywords", 300))
 def get_keywords():
   """Lista as keywords cadastradas.
 
   Retorna uma lista de keywords.
   """
   try:
-    keywords = Keyword.query.all()
-    return jsonify([KeywordSchema.from_orm(keyword).dict() for keyword in keywords])
+    return snapshot_response(website_service.get_keywords_snapshot())
   except Exception as e:
     return {"error": str(e)}, 500
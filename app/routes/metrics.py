@@ -0,0 +1,30 @@
+from flask_openapi3 import APIBlueprint, Tag
+
+from app.lib.db_pool import pool_metrics
+from app.lib.validate_admin_password import get_admin_password, validate_admin_password
+from app.models.database import db
+from app.schemas.admin_header import AdminHeaderSchema
+from app.schemas.error import ErrorSchema
+from app.schemas.metrics import MetricsSchema
+from app.services.click_aggregator import click_aggregator
+from app.services.shortener import URLShortenerService
+
+metrics_bp = APIBlueprint('metrics', __name__, url_prefix = '/')
+metrics_tag = Tag(name="Monitoramento", description="Métricas internas da API")
+shorten_service = URLShortenerService()
+
+@metrics_bp.get('/metrics', tags=[metrics_tag], responses={"200": MetricsSchema, "403": ErrorSchema})
+def get_metrics(header: AdminHeaderSchema):
+  """Retorna métricas do pool de conexões, do cache de redirecionamento e dos cliques pendentes.
+
+  Os valores são do processo que atendeu a requisição. Requer senha de administrador.
+  """
+  validate_admin_password(get_admin_password(header))
+
+  metrics = MetricsSchema(
+    database_pool=pool_metrics(db.engine),
+    replicas=db.router.status(),
+    redirect_cache=shorten_service.cache_stats(),
+    pending_clicks=click_aggregator.pending(),
+  )
+  return metrics.dict(), 200
@@ -1,14 +1,34 @@
+from datetime import datetime, timedelta
+
 from flask import jsonify
 from flask import redirect as flask_redirect
 from flask_openapi3 import APIBlueprint, Tag
 from sqlalchemy.exc import IntegrityError
 
+from app.lib.db_routing import read_only_route
+from app.lib.http_cache import cache_max_age, conditional_get
+from app.lib.pagination import InvalidCursorError
+from app.lib.url_fingerprint import url_fingerprint
+from app.lib.validate_URL import validate_URL
 from app.models.database import db
+from app.models.URL_mapping import URLMapping
 from app.schemas.error import ErrorSchema
-from app.schemas.URL_analytics import URLAnalyticsSchema
+from app.schemas.pagination import PaginationQuerySchema
+from app.schemas.URL_analytics import (
+  ClickBucketSchema,
+  TimeseriesPathSchema,
+  TimeseriesQuerySchema,
+  URLAnalyticsPageSchema,
+  URLAnalyticsSchema,
+  URLTimeseriesSchema,
+)
 from app.schemas.URL_mapping import (
   RedirectPathSchema,
+  URLBulkCreateSchema,
+  URLBulkItemSchema,
+  URLBulkResultSchema,
   URLCreateSchema,
+  URLMappingPageSchema,
   URLMappingSchema,
 )
 from app.services.shortener import URLShortenerService
@@ -17,20 +37,37 @@ shorteners_bp = APIBlueprint('shorteners', __name__, url_prefix = '/')
 shortener_tag = Tag(name="Encurtador", description="Rotas da entidade encurtador")
 shorten_service = URLShortenerService()
 
-@shorteners_bp.get('/shorteners', tags=[shortener_tag], responses={"200": URLMappingSchema, "500": ErrorSchema})
-def get_shorteners():
-  """Lista as URLs encurtadas."""
+@shorteners_bp.get('/shorteners', tags=[shortener_tag], responses={"200": URLMappingPageSchema, "400": ErrorSchema, "500": ErrorSchema})
+@read_only_route
+@conditional_get(URLMapping.created_at, max_age=cache_max_age("shorteners", 30))
+def get_shorteners(query: PaginationQuerySchema):
+  """Lista as URLs encurtadas.
+
+  Com `limit` ou `after`, retorna uma página e o `next_cursor` da próxima.
+  """
   try:
-    shorteners = shorten_service.get_all_mappings()
-    payload = [URLMappingSchema.from_orm(s).dict() for s in shorteners]
+    if not query.is_paginated:
+      shorteners = shorten_service.get_all_mappings()
+      return jsonify([URLMappingSchema.from_orm(s).dict() for s in shorteners]), 200
 
-    return jsonify(payload), 200
+    shorteners, next_cursor = shorten_service.get_mappings_page(query.limit, query.after)
+    payload = URLMappingPageSchema(
+      items=[URLMappingSchema.from_orm(s) for s in shorteners],
+      next_cursor=next_cursor,
+    )
+
+    return jsonify(payload.dict()), 200
+  except InvalidCursorError as e:
+    return {"error": str(e)}, 400
   except Exception as e:
     return {"error": str(e)}, 500
 
 @shorteners_bp.post('/shorten', tags=[shortener_tag], responses={"200": URLMappingSchema, "500": ErrorSchema})
 def shorten(body: URLCreateSchema):
-  """Encurta URL."""
+  """Encurta URL.
+
+  Se a URL já foi encurtada antes, retorna o código existente.
+  """
   try:
     new_url = shorten_service.create_mapping(body.url)
     payload = URLMappingSchema.from_orm(new_url).dict()
@@ -44,31 +81,117 @@ def shorten(body: URLCreateSchema):
     db.session.rollback()
     return {"error": str(e)}, 500
 
+@shorteners_bp.post('/shorten/bulk', tags=[shortener_tag], responses={"200": URLBulkResultSchema, "500": ErrorSchema})
+def shorten_bulk(body: URLBulkCreateSchema):
+  """Encurta várias URLs de uma vez.
+
+  Cada URL é validada separadamente: as inválidas ou repetidas no lote voltam
+  com `status` e `error`, sem impedir a criação das demais. URLs já encurtadas
+  antes retornam o código existente com `status` `existing`. Os resultados vêm
+  na mesma ordem da entrada.
+  """
+  try:
+    items: list[URLBulkItemSchema] = []
+    first_index: dict[str, int] = {}
+    to_create: list[int] = []
+
+    for index, url in enumerate(body.urls):
+      if not validate_URL(url):
+        items.append(URLBulkItemSchema(url=url, status='invalid', error='URL inválida.'))
+        continue
+
+      fingerprint = url_fingerprint(url)
+      if fingerprint in first_index:
+        items.append(URLBulkItemSchema(
+          url=url, status='duplicate', error=f'URL repetida no lote, veja a posição {first_index[fingerprint]}.'
+        ))
+      else:
+        first_index[fingerprint] = index
+        items.append(URLBulkItemSchema(url=url, status='created'))
+        to_create.append(index)
+
+    results = shorten_service.create_mappings([body.urls[index] for index in to_create])
+    for index, (mapping, created) in zip(to_create, results):
+      items[index].status = 'created' if created else 'existing'
+      items[index].short_url = mapping.short_url
+      items[index].created_at = mapping.created_at
+
+    created_count = sum(created for _, created in results)
+    payload = URLBulkResultSchema(
+      items=items,
+      created=created_count,
+      existing=len(results) - created_count,
+      failed=len(items) - len(results),
+    )
+    return jsonify(payload.dict()), 200
+
+  except Exception as e:
+    db.session.rollback()
+    return {"error": str(e)}, 500
+
 @shorteners_bp.get('/nos/<string:short_url>', tags=[shortener_tag], responses={"302": None, "404": ErrorSchema, "500": ErrorSchema})
 def handle_url_redirection(path: RedirectPathSchema):
   """Acessa a url original."""
   try:
-    url_mapping = shorten_service.get_mapping(path.short_url)
+    original_url = shorten_service.resolve(path.short_url)
 
-    if not url_mapping:
+    if not original_url:
       return {"error": "URL não encontrada"}, 404
 
     shorten_service.track_access(path.short_url)
 
-    return flask_redirect(url_mapping.original_url, code=302)
+    return flask_redirect(original_url, code=302)
 
-  except ValueError:
-    return {"error": "Formato de URL inválido"}, 400
   except Exception as e:
     db.session.rollback()
     return {"error": str(e)}, 500
 
-@shorteners_bp.get('/shorteners/analytics' ,tags=[shortener_tag], responses={"200": URLAnalyticsSchema, "500": ErrorSchema})
-def listAnalytics():
-  """Lista os registros de analytics."""
+@shorteners_bp.get('/shorteners/analytics' ,tags=[shortener_tag], responses={"200": URLAnalyticsPageSchema, "400": ErrorSchema, "500": ErrorSchema})
+@read_only_route
+def listAnalytics(query: PaginationQuerySchema):
+  """Lista os registros de analytics.
+
+  Com `limit` ou `after`, retorna uma página e o `next_cursor` da próxima.
+  """
+  try:
+    if not query.is_paginated:
+      analytics = shorten_service.get_all_analytics()
+      return jsonify([URLAnalyticsSchema.from_orm(item).dict() for item in analytics])
+
+    analytics, next_cursor = shorten_service.get_analytics_page(query.limit, query.after)
+    payload = URLAnalyticsPageSchema(
+      items=[URLAnalyticsSchema.from_orm(item) for item in analytics],
+      next_cursor=next_cursor,
+    )
+
+    return jsonify(payload.dict())
+  except InvalidCursorError as e:
+    return {"error": str(e)}, 400
+  except Exception as e:
+    return {"error": str(e)}, 500
+
+@shorteners_bp.get('/shorteners/analytics/<string:short_url>/timeseries', tags=[shortener_tag], responses={"200": URLTimeseriesSchema, "400": ErrorSchema, "404": ErrorSchema, "500": ErrorSchema})
+@read_only_route
+def get_analytics_timeseries(path: TimeseriesPathSchema, query: TimeseriesQuerySchema):
+  """Lista os cliques de uma URL encurtada agrupados por hora ou dia."""
   try:
-    analytics = shorten_service.get_all_analytics()
+    end = query.end or datetime.utcnow()
+    start = query.start or end - timedelta(days=30)
 
-    return jsonify([URLAnalyticsSchema.from_orm(item).dict() for item in analytics])
+    if start >= end:
+      return {"error": "O início do intervalo deve ser anterior ao fim"}, 400
+
+    if not shorten_service.resolve(path.short_url):
+      return {"error": "URL não encontrada"}, 404
+
+    points = shorten_service.get_click_timeseries(path.short_url, start, end, query.granularity)
+    payload = URLTimeseriesSchema(
+      short_url=path.short_url,
+      granularity=query.granularity,
+      points=[ClickBucketSchema(bucket_start=bucket_start, click_count=count) for bucket_start, count in points],
+    )
+
+    return jsonify(payload.dict())
   except Exception as e:
+    db.session.rollback()
     return {"error": str(e)}, 500
@@ -5,18 +5,36 @@ from flask_openapi3 import APIBlueprint
 from sqlalchemy.exc import IntegrityError
 from werkzeug.exceptions import HTTPException
 
+from app.lib.db_routing import read_only_route
+from app.lib.http_cache import cache_max_age, conditional_get
+from app.lib.pagination import InvalidCursorError
+from app.lib.snapshot import snapshot_response
 from app.lib.tags import websites_tag
 from app.lib.validate_admin_password import get_admin_password, validate_admin_password
 from app.models.database import db
+from app.models.keyword import Keyword
+from app.models.website import Website
 from app.schemas.admin_header import AdminHeaderSchema
 from app.schemas.error import ErrorSchema
 from app.schemas.message import MessageSchema
+from app.schemas.pagination import PaginationQuerySchema
 from app.schemas.pre_website import (
     PreWebsiteResponseSchema,
     PreWebsiteSchema,
     PreWebsiteUpdateBodySchema,
 )
-from app.schemas.website import WebsitePathSchema, WebsiteSchema
+from app.schemas.scrape_job import (
+    PreRegisterQuerySchema,
+    ScrapeJobPathSchema,
+    ScrapeJobSchema,
+)
+from app.schemas.website import (
+    WebsitePageSchema,
+    WebsitePathSchema,
+    WebsiteSchema,
+    WebsiteSearchQuerySchema,
+)
+from app.services.scrape_jobs import ScrapeJobService
 from app.services.shortener import URLShortenerService
 from app.services.website import (
     DuplicateWebsiteError,
@@ -28,22 +46,66 @@ from app.services.website import (
 websites_bp = APIBlueprint("websites", __name__, url_prefix="/")
 shorten_service = URLShortenerService()
 website_service = WebsiteService(shorten_service)
+scrape_job_service = ScrapeJobService(website_service)
+websites_max_age = cache_max_age("websites", 60)
 
 
 @websites_bp.get(
     "/websites",
     tags=[websites_tag],
-    responses={"200": WebsiteSchema, "500": ErrorSchema},
+    responses={"200": WebsitePageSchema, "400": ErrorSchema, "500": ErrorSchema},
 )
-def get_websites():
+@read_only_route
+@conditional_get(Website.updatedAt, Keyword.updatedAt, max_age=websites_max_age)
+def get_websites(query: PaginationQuerySchema):
     """Lista os sites cadastrados.
 
-    Retorna uma lista de websites.
+    Retorna uma lista de websites. Com `limit` ou `after`, retorna uma página
+    e o `next_cursor` da próxima.
     """
     try:
-        websites = website_service.get_all_websites()
+        if not query.is_paginated:
+            return snapshot_response(website_service.get_websites_snapshot())
+
+        websites, next_cursor = website_service.get_websites_page(query.limit, query.after)
+        payload = WebsitePageSchema(
+            items=[WebsiteSchema.from_orm(website) for website in websites],
+            next_cursor=next_cursor,
+        )
+
+        return jsonify(payload.dict())
+    except InvalidCursorError as e:
+        return {"error": str(e)}, 400
+    except Exception as e:
+        return {"error": str(e)}, 500
+
 
-        return jsonify([WebsiteSchema.from_orm(website).dict() for website in websites])
+@websites_bp.get(
+    "/websites/search",
+    tags=[websites_tag],
+    responses={"200": WebsitePageSchema, "400": ErrorSchema, "500": ErrorSchema},
+)
+@read_only_route
+@conditional_get(Website.updatedAt, Keyword.updatedAt, max_age=websites_max_age)
+def search_websites(query: WebsiteSearchQuerySchema):
+    """Busca sites por texto e palavras-chave.
+
+    `q` é buscado no nome e na descrição e os resultados vêm ordenados por
+    relevância. `keywords` filtra os sites que têm todas as palavras-chave
+    informadas. A resposta é sempre paginada.
+    """
+    try:
+        websites, next_cursor = website_service.search_websites(
+            query.q, query.keyword_names, query.limit, query.after
+        )
+        payload = WebsitePageSchema(
+            items=[WebsiteSchema.from_orm(website) for website in websites],
+            next_cursor=next_cursor,
+        )
+
+        return jsonify(payload.dict())
+    except InvalidCursorError as e:
+        return {"error": str(e)}, 400
     except Exception as e:
         return {"error": str(e)}, 500
 
@@ -53,6 +115,8 @@ def get_websites():
     tags=[websites_tag],
     responses={"200": WebsiteSchema, "404": ErrorSchema, "500": ErrorSchema},
 )
+@read_only_route
+@conditional_get(Website.updatedAt, Keyword.updatedAt, max_age=websites_max_age)
 def get_website(path: WebsitePathSchema):
     """Busca um site específico pelo ID."""
     try:
@@ -70,14 +134,26 @@ def get_website(path: WebsitePathSchema):
 @websites_bp.post(
     "/website",
     tags=[websites_tag],
-    responses={"200": PreWebsiteResponseSchema, "400": ErrorSchema, "500": ErrorSchema},
+    responses={
+        "200": PreWebsiteResponseSchema,
+        "202": ScrapeJobSchema,
+        "400": ErrorSchema,
+        "500": ErrorSchema,
+    },
 )
-def pre_register_website(body: PreWebsiteSchema):
+def pre_register_website(body: PreWebsiteSchema, query: PreRegisterQuerySchema):
     """Registra um site para validação e possível inclusão no webring.
     Se já existe um PreWebsite com a mesma URL, atualiza os dados.
+
+    Com `background=true`, apenas enfileira o pré-cadastro e retorna 202 com o job,
+    que pode ser acompanhado em `/website/jobs/<id>`.
     """
     try:
         url = body.url
+
+        if query.background:
+            job = scrape_job_service.enqueue(url)
+            return ScrapeJobSchema.from_orm(job).dict(), 202
         pre_website = website_service.pre_register_website(url)
 
         return PreWebsiteResponseSchema.from_orm(pre_website).dict()
@@ -101,6 +177,23 @@ def pre_register_website(body: PreWebsiteSchema):
         return {"error": str(e)}, 500
 
 
+@websites_bp.get(
+    "/website/jobs/<int:job_id>",
+    tags=[websites_tag],
+    responses={"200": ScrapeJobSchema, "404": ErrorSchema, "500": ErrorSchema},
+)
+def get_scrape_job(path: ScrapeJobPathSchema):
+    """Consulta o status de um pré-cadastro em segundo plano."""
+    try:
+        job = scrape_job_service.get_job(path.job_id)
+        if not job:
+            return {"error": "Job não encontrado"}, 404
+
+        return ScrapeJobSchema.from_orm(job).dict()
+    except Exception as e:
+        return {"error": str(e)}, 500
+
+
 @websites_bp.patch(
     "/website",
     tags=[websites_tag],
@@ -1,6 +1,7 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 
 
 class URLAnalyticsSchema(BaseModel):
@@ -11,3 +12,33 @@ class URLAnalyticsSchema(BaseModel):
 
   class Config:
     orm_mode = True
+
+class URLAnalyticsPageSchema(BaseModel):
+  """Página de analytics com o cursor da próxima página."""
+  items: list[URLAnalyticsSchema]
+  next_cursor: str | None = None
+
+class TimeseriesPathSchema(BaseModel):
+  short_url: str
+
+class TimeseriesQuerySchema(BaseModel):
+  """Intervalo [start, end) em UTC. Por padrão, os últimos 30 dias."""
+  start: datetime | None = None
+  end: datetime | None = None
+  granularity: Literal['hour', 'day'] = 'day'
+
+  @validator('start', 'end')
+  def as_naive_utc(cls, v):
+    if v and v.tzinfo:
+      return v.astimezone(timezone.utc).replace(tzinfo=None)
+    return v
+
+class ClickBucketSchema(BaseModel):
+  bucket_start: datetime
+  click_count: int
+
+class URLTimeseriesSchema(BaseModel):
+  """Série temporal de cliques de uma URL encurtada."""
+  short_url: str
+  granularity: str
+  points: list[ClickBucketSchema]
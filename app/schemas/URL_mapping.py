@@ -1,9 +1,12 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 
 from app.lib.validate_URL import validate_URL
 
+MAX_BULK_URLS = 1000
+
 
 class URLMappingSchema(BaseModel):
   """URLMapping representation with short_url, original_url, and created_at."""
@@ -14,6 +17,11 @@ class URLMappingSchema(BaseModel):
   class Config:
     orm_mode = True
 
+class URLMappingPageSchema(BaseModel):
+  """Página de URLs encurtadas com o cursor da próxima página."""
+  items: list[URLMappingSchema]
+  next_cursor: str | None = None
+
 class URLCreateSchema(BaseModel):
   url: str
 
@@ -23,5 +31,23 @@ class URLCreateSchema(BaseModel):
       raise ValueError('URL inválida.')
     return v
 
+class URLBulkCreateSchema(BaseModel):
+  """URLs a encurtar; cada uma é validada separadamente."""
+  urls: list[str] = Field(..., min_items=1, max_items=MAX_BULK_URLS)
+
+class URLBulkItemSchema(BaseModel):
+  """Resultado de uma URL do lote, na mesma posição da entrada."""
+  url: str
+  status: Literal['created', 'existing', 'invalid', 'duplicate']
+  short_url: str | None = None
+  created_at: datetime | None = None
+  error: str | None = None
+
+class URLBulkResultSchema(BaseModel):
+  items: list[URLBulkItemSchema]
+  created: int
+  existing: int
+  failed: int
+
 class RedirectPathSchema(BaseModel):
   short_url: str
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+
+class PoolMetricsSchema(BaseModel):
+    """Estado do pool de conexões com o banco de dados."""
+
+    pool_class: str
+    size: int | None = None
+    checked_in: int | None = None
+    checked_out: int | None = None
+    overflow: int | None = None
+    checkouts: int | None = None
+    timeouts: int | None = None
+    wait_seconds_total: float | None = None
+    wait_seconds_max: float | None = None
+
+
+class CacheStatsSchema(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class MetricsSchema(BaseModel):
+    """Métricas do processo que atendeu a requisição."""
+
+    database_pool: PoolMetricsSchema
+    replicas: dict[str, bool]
+    redirect_cache: CacheStatsSchema
+    pending_clicks: int
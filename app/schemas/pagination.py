@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+from app.lib.pagination import MAX_PAGE_SIZE
+
+
+class PaginationQuerySchema(BaseModel):
+    """Paginação por cursor. Sem `limit` e `after`, a lista completa é retornada."""
+
+    limit: int | None = Field(None, ge=1, le=MAX_PAGE_SIZE, description="Quantidade de itens por página.")
+    after: str | None = Field(None, description="Cursor `next_cursor` retornado pela página anterior.")
+
+    @property
+    def is_paginated(self) -> bool:
+        return self.limit is not None or self.after is not None
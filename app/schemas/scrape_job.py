@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ScrapeJobSchema(BaseModel):
+    """Job de pré-cadastro processado em segundo plano."""
+
+    id: int
+    url: str
+    status: str
+    error: str | None = None
+    pre_website_id: int | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class ScrapeJobPathSchema(BaseModel):
+    job_id: int
+
+
+class PreRegisterQuerySchema(BaseModel):
+    background: bool = False
@@ -1,8 +1,9 @@
 from flask import abort, jsonify, make_response
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 
 from app.schemas.error import ErrorSchema
 from app.schemas.keyword import KeywordSchema
+from app.schemas.pagination import PaginationQuerySchema
 
 
 class WebsiteSchema(BaseModel):
@@ -33,6 +34,28 @@ class WebsiteSchema(BaseModel):
         orm_mode = True
 
 
+class WebsitePageSchema(BaseModel):
+    """Página de websites com o cursor da próxima página."""
+
+    items: list[WebsiteSchema]
+    next_cursor: str | None = None
+
+
+class WebsiteSearchQuerySchema(PaginationQuerySchema):
+    """Busca textual e filtro por palavras-chave, sempre paginada."""
+
+    q: str | None = Field(None, max_length=200, description="Texto buscado no nome e na descrição.")
+    keywords: str | None = Field(
+        None, description="Palavras-chave separadas por vírgula; o site precisa ter todas."
+    )
+
+    @property
+    def keyword_names(self) -> list[str]:
+        if not self.keywords:
+            return []
+        return sorted({name.strip() for name in self.keywords.split(",") if name.strip()})
+
+
 class WebsiteCreateSchema(BaseModel):
     name: str = ""
     url: str
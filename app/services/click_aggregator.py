@@ -0,0 +1,106 @@
+import atexit
+import os
+import threading
+from datetime import datetime
+from typing import Callable
+
+
+def hour_bucket(moment: datetime) -> datetime:
+  return moment.replace(minute=0, second=0, microsecond=0)
+
+
+class ClickAggregator:
+  """Accumulates redirect clicks in memory and writes them in periodic batches.
+
+  Clicks are keyed by short_url and hourly bucket. Each flush hands the pending
+  deltas to the writer in one call, so the redirect never waits on the
+  analytics write.
+  """
+
+  def __init__(self, flush_interval: float = 5.0, max_pending: int = 1000):
+    self.flush_interval = flush_interval
+    self.max_pending = max_pending
+    self._app = None
+    self._writer: Callable[[dict], None] | None = None
+    self._pending: dict[tuple, list] = {}
+    self._lock = threading.Lock()
+    self._wakeup = threading.Event()
+    self._worker: threading.Thread | None = None
+    self._worker_pid: int | None = None
+
+  def init_app(self, app, writer: Callable[[dict], None]) -> None:
+    self._app = app
+    self._writer = writer
+    atexit.register(self.flush)
+
+  def add(self, short_url: str, accessed_at: datetime | None = None) -> None:
+    accessed_at = accessed_at or datetime.utcnow()
+    key = (short_url, hour_bucket(accessed_at))
+
+    with self._lock:
+      entry = self._pending.get(key)
+      if entry:
+        entry[0] += 1
+        entry[1] = max(entry[1], accessed_at)
+      else:
+        self._pending[key] = [1, accessed_at]
+      pending_count = len(self._pending)
+
+    self._ensure_worker()
+    if pending_count >= self.max_pending:
+      self._wakeup.set()
+
+  def pending(self) -> int:
+    with self._lock:
+      return sum(delta for delta, _ in self._pending.values())
+
+  def flush(self) -> int:
+    with self._lock:
+      batch, self._pending = self._pending, {}
+
+    if not batch or self._app is None:
+      return 0
+
+    try:
+      with self._app.app_context():
+        self._writer(batch)
+    except Exception:
+      self._app.logger.exception("Falha ao gravar cliques, serão reenviados no próximo flush")
+      self._requeue(batch)
+      return 0
+
+    return sum(delta for delta, _ in batch.values())
+
+  def _requeue(self, batch: dict[tuple, list]) -> None:
+    with self._lock:
+      for key, (delta, accessed_at) in batch.items():
+        entry = self._pending.get(key)
+        if entry:
+          entry[0] += delta
+          entry[1] = max(entry[1], accessed_at)
+        else:
+          self._pending[key] = [delta, accessed_at]
+
+  def _ensure_worker(self) -> None:
+    # Threads don't survive a fork, so a pre-forked worker starts its own on first use.
+    if self._worker and self._worker.is_alive() and self._worker_pid == os.getpid():
+      return
+
+    with self._lock:
+      if self._worker and self._worker.is_alive() and self._worker_pid == os.getpid():
+        return
+      self._worker = threading.Thread(target=self._run, name="click-aggregator", daemon=True)
+      self._worker_pid = os.getpid()
+      self._worker.start()
+
+  def _run(self) -> None:
+    while True:
+      self._wakeup.wait(self.flush_interval)
+      self._wakeup.clear()
+      self.flush()
+
+
+click_aggregator = ClickAggregator(
+  flush_interval=float(os.getenv("CLICK_FLUSH_INTERVAL", "5")),
+  max_pending=int(os.getenv("CLICK_FLUSH_MAX_PENDING", "1000")),
+)
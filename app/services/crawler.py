@@ -0,0 +1,211 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from urllib.parse import urljoin, urlsplit
+
+from sqlalchemy import case, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.lib.metadata_parser import PageMetadataParser
+from app.models.database import db, fits_column
+from app.models.website import Website
+from app.models.website_health import WebsiteHealth
+from app.services.website import MAX_HTML_BYTES
+
+REFRESHED_FIELDS = ("name", "description", "faviconUrl", "color")
+
+
+@dataclass
+class CrawlResult:
+    website_id: int
+    status_code: int | None = None
+    latency_ms: int | None = None
+    error: str | None = None
+    metadata: dict | None = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.status_code is not None and self.status_code < 400
+
+
+class WebsiteCrawler:
+    """Re-scrapes approved websites to refresh their metadata and record link health.
+
+    Sites are fetched concurrently, at most ``concurrency`` at a time and with
+    ``host_delay`` seconds between requests to the same host. No transaction
+    stays open while sites are fetched; database work happens once at the end:
+    a single bulk update for changed websites and a single upsert of the
+    health rows, skipping websites deleted during the crawl.
+    """
+
+    def __init__(self, website_service, concurrency: int = 8, host_delay: float = 1.0):
+        self.website_service = website_service
+        self.fetcher = website_service.fetcher
+        self.concurrency = concurrency
+        self.host_delay = host_delay
+        self._next_request_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def run(self) -> dict:
+        websites = Website.query.order_by(Website.id).all()
+        # Approved websites store the short code of their original URL.
+        mappings = self.website_service.shortener_service.get_mappings(
+            [website.url for website in websites if not website.url.startswith("http")]
+        )
+        targets = [(website.id, self._target_url(website, mappings)) for website in websites]
+        current = {website.id: {field: getattr(website, field) for field in REFRESHED_FIELDS} for website in websites}
+        # The crawl can take minutes; don't keep the read transaction idle meanwhile.
+        db.session.rollback()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="crawler") as pool:
+            results = list(pool.map(lambda target: self.crawl(*target), targets))
+
+        results = self._still_existing(results)
+        updated = self._apply_metadata(current, results)
+        self._record_health(results)
+        db.session.commit()
+
+        if updated:
+            self.website_service.snapshots.invalidate()
+
+        return {
+            "checked": len(results),
+            "updated": updated,
+            "unhealthy": [result.website_id for result in results if not result.healthy],
+        }
+
+    def crawl(self, website_id: int, url: str | None) -> CrawlResult:
+        result = CrawlResult(website_id=website_id)
+        if not url:
+            result.error = "URL original não encontrada"
+            return result
+
+        self._wait_for_host(url)
+        deadline = self.fetcher.deadline()
+        favicon_probe = self.fetcher.submit(urljoin(url, "/favicon.ico"), deadline, method="HEAD")
+        started = time.monotonic()
+
+        try:
+            with self.fetcher.request(url, deadline, stream=True) as resp:
+                result.status_code = resp.status_code
+                result.latency_ms = int((time.monotonic() - started) * 1000)
+                resp.raise_for_status()
+
+                page = PageMetadataParser()
+                for text in self.fetcher.iter_text(resp, deadline, MAX_HTML_BYTES):
+                    page.feed(text)
+                    if page.done:
+                        break
+                page.close()
+
+            manifest_color = self._manifest_theme_color(page, url, deadline)
+            result.metadata = self.website_service.extract_metadata(
+                page, url, favicon_probe, manifest_color, deadline
+            )
+        except Exception as error:
+            result.error = f"{type(error).__name__} - {error}"
+
+        return result
+
+    def _target_url(self, website: Website, mappings: dict) -> str | None:
+        if website.url.startswith("http"):
+            return website.url
+        url_mapping = mappings.get(website.url)
+        return url_mapping.original_url if url_mapping else None
+
+    def _wait_for_host(self, url: str) -> None:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at.get(host, now))
+            self._next_request_at[host] = start_at + self.host_delay
+        time.sleep(start_at - now)
+
+    def _manifest_theme_color(self, page: PageMetadataParser, url: str, deadline: float) -> str | None:
+        # Runs outside the app context, so the manifest skips the database-backed fetch cache.
+        if not page.manifest_href:
+            return None
+        try:
+            resp = self.fetcher.request(urljoin(url, page.manifest_href), deadline)
+            resp.raise_for_status()
+            return json.loads(resp.text).get("theme_color")
+        except Exception:
+            return None
+
+    def _still_existing(self, results: list[CrawlResult]) -> list[CrawlResult]:
+        """Drops results of websites deleted during the crawl.
+
+        The remaining rows are locked against deletion until the commit, so the
+        health upsert can't hit a foreign-key error.
+        """
+        if not results:
+            return results
+
+        existing = set(
+            db.session.scalars(
+                select(Website.id)
+                .where(Website.id.in_([result.website_id for result in results]))
+                .with_for_update(key_share=True)
+            )
+        )
+        return [result for result in results if result.website_id in existing]
+
+    def _apply_metadata(self, current: dict[int, dict], results: list[CrawlResult]) -> int:
+        now = datetime.utcnow().isoformat()
+        changes = []
+
+        for result in results:
+            if not result.metadata:
+                continue
+            fields = current[result.website_id]
+            # A value too long for its column would fail the whole bulk update; the site keeps the stored one.
+            changed = {
+                field: value
+                for field, value in result.metadata.items()
+                if field in REFRESHED_FIELDS
+                and value
+                and value != fields[field]
+                and fits_column(Website.__table__.c[field], value)
+            }
+            if changed:
+                changes.append({"id": result.website_id, "updatedAt": now, **changed})
+
+        if changes:
+            db.session.bulk_update_mappings(Website, changes)
+        return len(changes)
+
+    def _record_health(self, results: list[CrawlResult]) -> None:
+        if not results:
+            return
+
+        now = datetime.utcnow()
+        stmt = insert(WebsiteHealth).values([
+            {
+                "website_id": result.website_id,
+                "status_code": result.status_code,
+                "latency_ms": result.latency_ms,
+                "error": result.error,
+                "healthy": result.healthy,
+                "consecutive_failures": 0 if result.healthy else 1,
+                "checked_at": now,
+            }
+            for result in results
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WebsiteHealth.website_id],
+            set_={
+                "status_code": stmt.excluded.status_code,
+                "latency_ms": stmt.excluded.latency_ms,
+                "error": stmt.excluded.error,
+                "healthy": stmt.excluded.healthy,
+                "consecutive_failures": case(
+                    (stmt.excluded.healthy, 0),
+                    else_=WebsiteHealth.consecutive_failures + 1,
+                ),
+                "checked_at": stmt.excluded.checked_at,
+            },
+        )
+        db.session.execute(stmt)
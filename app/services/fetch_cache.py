@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.database import db, fits_column
+from app.models.fetch_cache import FetchCacheEntry
+
+
+class FetchCache:
+    """Persistent cache of scraped responses, revalidated with conditional requests.
+
+    Entries keep the validators (ETag / Last-Modified) and the already parsed
+    payload, so a 304 from the site skips both the download and the parsing.
+    """
+
+    def __init__(self, ttl: timedelta, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def lookup(self, url: str) -> FetchCacheEntry | None:
+        entry = db.session.get(FetchCacheEntry, url)
+        if entry and entry.fetched_at < datetime.utcnow() - self.ttl:
+            db.session.delete(entry)
+            return None
+        return entry
+
+    def conditional_headers(self, entry: FetchCacheEntry | None) -> dict[str, str]:
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def revalidated(self, entry: FetchCacheEntry) -> dict:
+        entry.last_used_at = datetime.utcnow()
+        return entry.payload
+
+    def store(self, url: str, response, payload: dict, body_digest: str, size: int) -> None:
+        """Caches a response inside a savepoint, so a failed write never breaks the caller's transaction.
+
+        Responses whose URL or validators don't fit their columns are not cached.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (
+            fits_column(FetchCacheEntry.url, url)
+            and fits_column(FetchCacheEntry.etag, etag)
+            and fits_column(FetchCacheEntry.last_modified, last_modified)
+        ):
+            return
+
+        now = datetime.utcnow()
+        try:
+            with db.session.begin_nested():
+                db.session.merge(
+                    FetchCacheEntry(
+                        url=url,
+                        etag=etag,
+                        last_modified=last_modified,
+                        body_digest=body_digest,
+                        payload=payload,
+                        size=size,
+                        fetched_at=now,
+                        last_used_at=now,
+                    )
+                )
+                self._evict()
+        except SQLAlchemyError:
+            current_app.logger.exception("Falha ao gravar %s no cache de páginas", url)
+
+    def _evict(self) -> None:
+        db.session.flush()
+        overflow = (
+            db.session.query(FetchCacheEntry.url)
+            .order_by(FetchCacheEntry.last_used_at.desc())
+            .offset(self.max_entries)
+            .subquery()
+        )
+        FetchCacheEntry.query.filter(FetchCacheEntry.url.in_(db.session.query(overflow.c.url))).delete(
+            synchronize_session=False
+        )
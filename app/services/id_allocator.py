@@ -0,0 +1,45 @@
+import os
+import threading
+from collections import deque
+
+from sqlalchemy import text
+
+from app.models.database import db
+
+
+class IdBlockAllocator:
+  """Hands out primary keys reserved in blocks from a Postgres sequence.
+
+  One round-trip reserves ``block_size`` ids, so callers know the id (and
+  anything derived from it) before inserting the row. Reserved ids that are
+  never used leave gaps in the sequence, which is harmless.
+  """
+
+  def __init__(self, table: str, column: str = 'id', block_size: int = 100):
+    self.table = table
+    self.column = column
+    self.block_size = block_size
+    self._ids: deque[int] = deque()
+    self._pid: int | None = None
+    self._lock = threading.Lock()
+
+  def allocate(self, count: int = 1) -> list[int]:
+    with self._lock:
+      # Ids reserved before a fork would be handed out again by every worker.
+      if self._pid != os.getpid():
+        self._pid = os.getpid()
+        self._ids.clear()
+
+      if len(self._ids) < count:
+        self._ids.extend(self._reserve(max(self.block_size, count - len(self._ids))))
+
+      return [self._ids.popleft() for _ in range(count)]
+
+  def _reserve(self, count: int) -> list[int]:
+    # Runs on its own primary connection, so it works inside read-only scopes and survives rollbacks.
+    with db.engine.connect() as connection:
+      rows = connection.execute(
+        text('SELECT nextval(pg_get_serial_sequence(:table, :column)) FROM generate_series(1, :count)'),
+        {'table': self.table, 'column': self.column, 'count': count},
+      )
+      return [row[0] for row in rows]
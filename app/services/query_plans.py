@@ -0,0 +1,121 @@
+import json
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select, text
+
+from app.lib.http_cache import validators_query
+from app.models.database import db
+from app.models.fetch_cache import FetchCacheEntry
+from app.models.keyword import Keyword
+from app.models.pre_website import PreWebsite
+from app.models.scrape_job import PENDING, ScrapeJob
+from app.models.URL_analytics import URLAnalytics
+from app.models.URL_click_bucket import HOUR, URLClickBucket
+from app.models.URL_mapping import URLMapping
+from app.models.website import SEARCH_CONFIG, Website, website_keyword
+
+
+def hot_queries() -> dict:
+    """The lookups the services run on every request or job, keyed by name.
+
+    Each one must be answerable from an index; a sequential scan, or an index
+    walked end to end while filtering rows, means a missing or unusable index
+    once the table grows.
+    """
+    now = datetime.utcnow()
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, "webring")
+
+    return {
+        "website by url": select(Website.id).where(Website.url == "https://example.com"),
+        "pre-website by url": select(PreWebsite.id).where(PreWebsite.url == "https://example.com"),
+        "websites by keyword": select(website_keyword.c.website_id).where(website_keyword.c.keyword_id == 1),
+        "keyword by name": select(Keyword.id).where(Keyword.name == "python"),
+        "website search": select(Website.id).where(Website.search_vector.op("@@")(ts_query)),
+        "websites validators": validators_query(Website.updatedAt, Keyword.updatedAt),
+        "keywords validators": validators_query(Keyword.updatedAt),
+        "mapping by id": select(URLMapping.original_url).where(URLMapping.id == 1),
+        "mapping by short url": select(URLMapping.id).where(URLMapping.short_url == "b"),
+        "shorteners validators": validators_query(URLMapping.created_at),
+        "analytics by short url": select(URLAnalytics.click_count).where(URLAnalytics.short_url == "b"),
+        "click timeseries": select(URLClickBucket.click_count).where(
+            URLClickBucket.short_url == "b",
+            URLClickBucket.bucket_start >= now - timedelta(days=7),
+            URLClickBucket.bucket_start < now,
+        ),
+        "click rollup": select(URLClickBucket.short_url).where(
+            URLClickBucket.granularity == HOUR,
+            URLClickBucket.bucket_start < now - timedelta(days=7),
+        ),
+        "next scrape job": select(ScrapeJob.id)
+        .where(ScrapeJob.status == PENDING)
+        .order_by(ScrapeJob.id)
+        .limit(1),
+        "fetch cache eviction": select(FetchCacheEntry.url)
+        .order_by(FetchCacheEntry.last_used_at.desc())
+        .offset(1000),
+    }
+
+
+def explain(stmt) -> dict:
+    """Returns the JSON plan Postgres picks for ``stmt``, with sequential scans disabled.
+
+    Discouraging sequential scans makes the planner use an index whenever one
+    applies, so small development databases give the same answer as large ones.
+    """
+    connection = db.session.connection()
+    compiled = stmt.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    row = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    plan = row if isinstance(row, list) else json.loads(row)
+    return plan[0]["Plan"]
+
+
+def index_leading_columns() -> dict[str, str]:
+    """Maps each index in the current schema to its first column; expression indexes are left out."""
+    rows = db.session.execute(
+        text(
+            "SELECT index_class.relname, attribute.attname"
+            " FROM pg_index"
+            " JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid"
+            " JOIN pg_namespace ON pg_namespace.oid = index_class.relnamespace"
+            " JOIN pg_attribute attribute"
+            "   ON attribute.attrelid = pg_index.indrelid AND attribute.attnum = pg_index.indkey[0]"
+            " WHERE pg_namespace.nspname = current_schema()"
+        )
+    )
+    return dict(rows.all())
+
+
+def unindexed_scans(plan: dict, leading_columns: dict[str, str]) -> list[str]:
+    """Lists the scans in ``plan`` that read a whole table or a whole index.
+
+    With sequential scans disabled, Postgres walks an entire index rather than
+    use none: either filtering rows it has already read, or matching a column
+    that isn't the first one of the index.
+    """
+    scans = []
+    node_type = plan.get("Node Type")
+    if node_type == "Seq Scan":
+        scans.append(f"seq scan em {plan['Relation Name']}")
+    elif node_type in ("Index Scan", "Index Only Scan", "Bitmap Index Scan"):
+        condition = plan.get("Index Cond")
+        leading_column = leading_columns.get(plan["Index Name"])
+        if condition is None and "Filter" in plan or (
+            condition is not None
+            and leading_column is not None
+            and not re.search(rf'\b"?{re.escape(leading_column)}"?\b', condition)
+        ):
+            scans.append(f"índice {plan['Index Name']} lido inteiro")
+    for child in plan.get("Plans", []):
+        scans.extend(unindexed_scans(child, leading_columns))
+    return scans
+
+
+def check_query_plans() -> dict[str, list[str]]:
+    """Maps each hot query to its scans that no index narrows; empty lists mean indexed plans."""
+    try:
+        leading_columns = index_leading_columns()
+        return {name: unindexed_scans(explain(stmt), leading_columns) for name, stmt in hot_queries().items()}
+    finally:
+        db.session.rollback()
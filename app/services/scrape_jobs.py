@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from app.models.database import db
+from app.models.scrape_job import DONE, FAILED, PENDING, RUNNING, ScrapeJob
+from app.services.shortener import URLShortenerService
+from app.services.website import (
+    DuplicateWebsiteError,
+    WebringValidationError,
+    WebsiteService,
+)
+
+MAX_ATTEMPTS = int(os.getenv("SCRAPE_JOB_MAX_ATTEMPTS", "3"))
+STALE_AFTER = timedelta(seconds=int(os.getenv("SCRAPE_JOB_STALE_AFTER", "300")))
+
+
+class ScrapeJobService:
+    """Postgres-backed queue for website pre-registration.
+
+    Workers claim jobs with SELECT ... FOR UPDATE SKIP LOCKED, so any number
+    of threads or processes can poll the same table without double work.
+    Jobs left running by a crashed worker are claimed again once stale.
+    """
+
+    def __init__(self, website_service):
+        self.website_service = website_service
+
+    def enqueue(self, url: str) -> ScrapeJob:
+        job = ScrapeJob(url=url, status=PENDING)
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    def get_job(self, job_id: int) -> ScrapeJob | None:
+        return db.session.get(ScrapeJob, job_id)
+
+    def claim_next(self) -> ScrapeJob | None:
+        now = datetime.utcnow()
+        claimable = (ScrapeJob.status == PENDING) | (
+            (ScrapeJob.status == RUNNING) & (ScrapeJob.updated_at < now - STALE_AFTER)
+        )
+        job = (
+            ScrapeJob.query.filter(claimable)
+            .order_by(ScrapeJob.id)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if not job:
+            db.session.commit()
+            return None
+
+        if job.attempts >= MAX_ATTEMPTS:
+            job.status = FAILED
+            job.error = "Número máximo de tentativas excedido"
+            job.updated_at = now
+            db.session.commit()
+            return None
+
+        job.status = RUNNING
+        job.attempts += 1
+        job.updated_at = now
+        db.session.commit()
+        return job
+
+    def run(self, job: ScrapeJob) -> None:
+        try:
+            pre_website = self.website_service.pre_register_website(job.url)
+            job.status = DONE
+            job.error = None
+            job.pre_website_id = pre_website.id
+        except (WebringValidationError, DuplicateWebsiteError) as error:
+            db.session.rollback()
+            job.status = FAILED
+            job.error = str(error)
+        except Exception as error:
+            db.session.rollback()
+            job.status = FAILED
+            job.error = f"{type(error).__name__} - {error}"
+
+        job.updated_at = datetime.utcnow()
+        db.session.commit()
+
+    def process_next(self) -> bool:
+        job = self.claim_next()
+        if not job:
+            return False
+        self.run(job)
+        return True
+
+
+class ScrapeWorkerPool:
+    """Threads that drain the scrape job queue inside an app process."""
+
+    def __init__(self, workers: int, poll_interval: float = 1.0):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._threads: list[threading.Thread] = []
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self, app) -> None:
+        # Threads don't survive a fork, so each worker process starts its own.
+        if self._pid == os.getpid() or self.workers <= 0:
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            job_service = ScrapeJobService(WebsiteService(URLShortenerService()))
+            self._threads = [
+                threading.Thread(
+                    target=self.work,
+                    args=(app, job_service),
+                    name=f"scrape-worker-{index}",
+                    daemon=True,
+                )
+                for index in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def join(self) -> None:
+        for thread in self._threads:
+            thread.join()
+
+    def work(self, app, job_service: ScrapeJobService) -> None:
+        while True:
+            try:
+                with app.app_context():
+                    processed = job_service.process_next()
+            except Exception:
+                app.logger.exception("Falha ao processar job de pré-cadastro")
+                processed = False
+
+            if not processed:
+                time.sleep(self.poll_interval)
+
+
+scrape_workers = ScrapeWorkerPool(
+    workers=int(os.getenv("SCRAPE_WORKERS", "1")),
+    poll_interval=float(os.getenv("SCRAPE_POLL_INTERVAL", "1")),
+)
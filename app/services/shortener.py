@@ -1,41 +1,282 @@
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
 
-from app.lib.base62 import decode_base62, encode_base62
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.lib.base62 import decode_base62_many, encode_base62_many, try_decode_base62
+from app.lib.cache import MISSING, LRUCache
+from app.lib.db_routing import read_only
+from app.lib.pagination import paginate
+from app.lib.url_fingerprint import url_fingerprint
 from app.models.database import db
 from app.models.URL_analytics import URLAnalytics
+from app.models.URL_click_bucket import DAY, HOUR, URLClickBucket
 from app.models.URL_mapping import URLMapping
+from app.services.click_aggregator import ClickAggregator, click_aggregator, hour_bucket
+from app.services.id_allocator import IdBlockAllocator
+
+NEGATIVE_CACHE_TTL = float(os.getenv("SHORTENER_NEGATIVE_CACHE_TTL", "30"))
+BUFFER_CLICKS = os.getenv("CLICK_BUFFER", "true") != "false"
+# Serves cached redirects from a WSGI middleware; only used with buffered clicks, see create_app.
+REDIRECT_FAST_PATH = os.getenv("REDIRECT_FAST_PATH", "false") == "true"
+NOT_FOUND = object()
+# url_mappings.id is a 32-bit integer; larger codes can't exist and would overflow the lookup.
+MAX_MAPPING_ID = 2**31 - 1
+
+# Mappings never change once created, so every service instance shares one cache.
+mapping_cache = LRUCache(
+  max_size=int(os.getenv("SHORTENER_CACHE_SIZE", "10000")),
+  ttl=float(os.getenv("SHORTENER_CACHE_TTL", "3600")),
+)
+
+# Short codes are derived from the id, so ids are reserved up front to insert each mapping in one statement.
+mapping_ids = IdBlockAllocator(
+  URLMapping.__tablename__,
+  block_size=int(os.getenv("SHORTENER_ID_BLOCK_SIZE", "100")),
+)
+
+
+def mapping_id(short_url: str) -> int | None:
+  """Returns the id a short code stands for, or None if it can't belong to any mapping."""
+  url_id = try_decode_base62(short_url)
+  if url_id is None or url_id > MAX_MAPPING_ID:
+    return None
+  return url_id
 
 
 class URLShortenerService:
+  def __init__(
+    self,
+    cache: LRUCache = mapping_cache,
+    clicks: ClickAggregator = click_aggregator,
+    ids: IdBlockAllocator = mapping_ids,
+  ):
+    self.cache = cache
+    self.clicks = clicks
+    self.ids = ids
+
   def get_all_mappings(self) -> list[URLMapping]:
-    return URLMapping.query.all()
+    return URLMapping.query.order_by(URLMapping.id).all()
+
+  def get_mappings_page(self, limit: int | None, after: str | None) -> tuple[list[URLMapping], str | None]:
+    return paginate(URLMapping.query, URLMapping.id, limit, after)
 
   def create_mapping(self, original_url: str) -> URLMapping:
-    new_url = URLMapping(original_url=original_url, short_url="")
+    """Returns the mapping for the URL, creating it only if the URL was never shortened."""
+    mapping, _ = self.create_mappings([original_url])[0]
+    return mapping
 
-    db.session.add(new_url)
-    db.session.flush()
+  def create_mappings(self, original_urls: list[str]) -> list[tuple[URLMapping, bool]]:
+    """Returns a (mapping, created) pair per URL, in input order.
 
-    new_url.short_url = encode_base62(new_url.id)
-    db.session.commit()
+    URLs already shortened are found with one indexed lookup by fingerprint;
+    the rest are written with a single multi-row INSERT. A URL shortened
+    concurrently by another request loses the insert and gets that mapping.
+    """
+    fingerprints = [url_fingerprint(url) for url in original_urls]
+    existing = self._find_by_fingerprints(set(fingerprints))
+
+    missing: dict[str, str] = {}
+    for original_url, fingerprint in zip(original_urls, fingerprints):
+      if fingerprint not in existing:
+        missing.setdefault(fingerprint, original_url)
 
-    return new_url
+    created: dict[str, URLMapping] = {}
+    if missing:
+      created_at = datetime.utcnow()
+      url_ids = self.ids.allocate(len(missing))
+      rows = [
+        {
+          "id": url_id,
+          "short_url": short_url,
+          "original_url": original_url,
+          "url_fingerprint": fingerprint,
+          "created_at": created_at,
+        }
+        for url_id, short_url, (fingerprint, original_url) in zip(url_ids, encode_base62_many(url_ids), missing.items())
+      ]
+      stmt = (
+        insert(URLMapping)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[URLMapping.url_fingerprint])
+        .returning(URLMapping.url_fingerprint)
+      )
+      inserted = set(db.session.execute(stmt).scalars())
+      db.session.commit()
+
+      created = {row["url_fingerprint"]: URLMapping(**row) for row in rows if row["url_fingerprint"] in inserted}
+      if len(inserted) < len(missing):
+        existing.update(self._find_by_fingerprints(set(missing) - inserted))
+
+    results = []
+    for fingerprint in fingerprints:
+      mapping = created.get(fingerprint) or existing[fingerprint]
+      self.cache.set(mapping.short_url, mapping.original_url)
+      results.append((mapping, fingerprint in created))
+    return results
+
+  def _find_by_fingerprints(self, fingerprints: set[str]) -> dict[str, URLMapping]:
+    if not fingerprints:
+      return {}
+    mappings = URLMapping.query.filter(URLMapping.url_fingerprint.in_(fingerprints)).all()
+    return {mapping.url_fingerprint: mapping for mapping in mappings}
 
   def get_mapping(self, short_url: str) -> URLMapping | None:
-    url_id = decode_base62(short_url)
-    return db.session.get(URLMapping, url_id)
+    url_id = mapping_id(short_url)
+    if url_id is None:
+      return None
 
-  def track_access(self, short_url: str) -> None:
-    analytics = URLAnalytics.query.filter_by(short_url=short_url).first()
+    with read_only():
+      url_mapping = db.session.get(URLMapping, url_id)
+
+    # A mapping created moments ago may not have reached the replica yet.
+    if url_mapping is None and db.router.bind_keys:
+      url_mapping = db.session.get(URLMapping, url_id)
+    return url_mapping
+
+  def get_mappings(self, short_urls: list[str]) -> dict[str, URLMapping]:
+    """Looks up many short codes with one query, keyed by code; codes no mapping could have are skipped."""
+    url_ids = [
+      url_id for url_id in decode_base62_many(short_urls)
+      if url_id is not None and url_id <= MAX_MAPPING_ID
+    ]
+    if not url_ids:
+      return {}
+
+    with read_only():
+      mappings = URLMapping.query.filter(URLMapping.id.in_(url_ids)).all()
+
+    if len(mappings) < len(set(url_ids)) and db.router.bind_keys:
+      mappings = URLMapping.query.filter(URLMapping.id.in_(url_ids)).all()
+    return {mapping.short_url: mapping for mapping in mappings}
+
+  def resolve(self, short_url: str) -> str | None:
+    """Returns the original URL for a short code, served from cache when possible.
+
+    Unknown codes are cached for a short period so repeated misses don't reach the database;
+    codes no mapping could have are rejected before touching the cache or the database.
+    """
+    if mapping_id(short_url) is None:
+      return None
 
-    if analytics:
-      analytics.click_count += 1
-      analytics.last_accessed = datetime.utcnow()
+    cached = self.cache.get(short_url)
+    if cached is NOT_FOUND:
+      return None
+    if cached is not MISSING:
+      return cached
+
+    url_mapping = self.get_mapping(short_url)
+    if not url_mapping:
+      self.cache.set(short_url, NOT_FOUND, ttl=NEGATIVE_CACHE_TTL)
+      return None
+
+    self.cache.set(short_url, url_mapping.original_url)
+    return url_mapping.original_url
+
+  def cached_original_url(self, short_url: str) -> str | None:
+    """Returns the original URL only if it is cached, leaving misses for resolve to count."""
+    cached = self.cache.get(short_url, None, count_miss=False)
+    return None if cached is NOT_FOUND else cached
+
+  def cache_stats(self) -> dict:
+    return self.cache.stats()
+
+  def track_access(self, short_url: str) -> None:
+    if BUFFER_CLICKS:
+      self.clicks.add(short_url)
     else:
-      new_analytics = URLAnalytics(short_url=short_url, click_count=1)
-      db.session.add(new_analytics)
+      now = datetime.utcnow()
+      self.record_clicks({(short_url, hour_bucket(now)): (1, now)})
+
+  def record_clicks(self, clicks: dict[tuple[str, datetime], tuple[int, datetime]]) -> None:
+    """Adds click deltas, keyed by (short_url, hourly bucket), with atomic upserts.
+
+    The increments happen in the database, so concurrent writers never lose
+    clicks or race on inserting the first row for a short_url.
+    """
+    if not clicks:
+      return
+
+    totals: dict[str, list] = {}
+    for (short_url, _), (delta, accessed_at) in clicks.items():
+      total = totals.setdefault(short_url, [0, accessed_at])
+      total[0] += delta
+      total[1] = max(total[1], accessed_at)
+
+    analytics_stmt = insert(URLAnalytics).values([
+      {"short_url": short_url, "click_count": delta, "last_accessed": accessed_at}
+      for short_url, (delta, accessed_at) in totals.items()
+    ])
+    analytics_stmt = analytics_stmt.on_conflict_do_update(
+      index_elements=[URLAnalytics.short_url],
+      set_={
+        "click_count": URLAnalytics.click_count + analytics_stmt.excluded.click_count,
+        "last_accessed": func.greatest(URLAnalytics.last_accessed, analytics_stmt.excluded.last_accessed),
+      },
+    )
 
+    buckets_stmt = insert(URLClickBucket).values([
+      {"short_url": short_url, "granularity": HOUR, "bucket_start": bucket_start, "click_count": delta}
+      for (short_url, bucket_start), (delta, _) in clicks.items()
+    ])
+    buckets_stmt = buckets_stmt.on_conflict_do_update(
+      index_elements=[URLClickBucket.short_url, URLClickBucket.granularity, URLClickBucket.bucket_start],
+      set_={"click_count": URLClickBucket.click_count + buckets_stmt.excluded.click_count},
+    )
+
+    db.session.execute(analytics_stmt)
+    db.session.execute(buckets_stmt)
     db.session.commit()
 
+  def rollup_click_buckets(self, older_than: timedelta) -> None:
+    """Compacts hourly click buckets older than the cutoff into daily buckets.
+
+    The hours are deleted and summed into days by one statement, so an
+    increment that lands on an old hour is either moved or waits for the
+    rollup to commit and recreates the hour; it is never deleted uncopied.
+    """
+    cutoff = (datetime.utcnow() - older_than).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    moved = (
+      delete(URLClickBucket)
+      .where(URLClickBucket.granularity == HOUR, URLClickBucket.bucket_start < cutoff)
+      .returning(URLClickBucket.short_url, URLClickBucket.bucket_start, URLClickBucket.click_count)
+      .cte("moved")
+    )
+    day_start = func.date_trunc(DAY, moved.c.bucket_start)
+    daily = (
+      select(moved.c.short_url, literal(DAY), day_start, func.sum(moved.c.click_count))
+      .group_by(moved.c.short_url, day_start)
+    )
+    stmt = insert(URLClickBucket).from_select(
+      ["short_url", "granularity", "bucket_start", "click_count"], daily
+    )
+    stmt = stmt.on_conflict_do_update(
+      index_elements=[URLClickBucket.short_url, URLClickBucket.granularity, URLClickBucket.bucket_start],
+      set_={"click_count": URLClickBucket.click_count + stmt.excluded.click_count},
+    )
+
+    db.session.execute(stmt)
+    db.session.commit()
+
+  def get_click_timeseries(self, short_url: str, start: datetime, end: datetime, granularity: str) -> list[tuple[datetime, int]]:
+    bucket = func.date_trunc(granularity, URLClickBucket.bucket_start).label("bucket")
+
+    return (
+      db.session.query(bucket, func.sum(URLClickBucket.click_count))
+      .filter(
+        URLClickBucket.short_url == short_url,
+        URLClickBucket.bucket_start >= start,
+        URLClickBucket.bucket_start < end,
+      )
+      .group_by(bucket)
+      .order_by(bucket)
+      .all()
+    )
+
   def get_all_analytics(self) -> list[URLAnalytics]:
-    return URLAnalytics.query.all()
+    return URLAnalytics.query.order_by(URLAnalytics.short_url).all()
+
+  def get_analytics_page(self, limit: int | None, after: str | None) -> tuple[list[URLAnalytics], str | None]:
+    return paginate(URLAnalytics.query, URLAnalytics.short_url, limit, after)
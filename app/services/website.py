@@ -1,49 +1,142 @@
+import hashlib
 import json
 import os
-import re
-from datetime import datetime
+from concurrent.futures import Future
+from datetime import datetime, timedelta
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
-
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.orm import selectinload
+
+from app.lib.fetcher import Fetcher, UnsupportedContentError
+from app.lib.http_cache import mark_deleted
+from app.lib.metadata_parser import (
+    INLINE_COLOR_RE,
+    PRIMARY_COLOR_RE,
+    PageMetadataParser,
+)
+from app.lib.pagination import paginate, paginate_ranked
+from app.lib.snapshot import Snapshot, SnapshotStore
 from app.models.database import db
 from app.models.keyword import Keyword
 from app.models.pre_website import PreWebsite
-from app.models.website import Website
+from app.models.website import SEARCH_CONFIG, Website, website_keyword
+from app.schemas.keyword import KeywordSchema
+from app.schemas.website import WebsiteSchema
+from app.services.fetch_cache import FetchCache
+
+# Public webring payloads only change on approval or deletion, so they are encoded once per change.
+webring_snapshots = SnapshotStore(ttl=float(os.getenv("SNAPSHOT_TTL", "60")))
+
+scraper = Fetcher(
+    max_workers=int(os.getenv("FETCH_MAX_WORKERS", "8")),
+    per_host_limit=int(os.getenv("FETCH_PER_HOST_LIMIT", "2")),
+    request_timeout=float(os.getenv("FETCH_REQUEST_TIMEOUT", "5")),
+    deadline=float(os.getenv("FETCH_DEADLINE", "8")),
+)
+MAX_HTML_BYTES = int(os.getenv("FETCH_MAX_HTML_BYTES", str(2 * 1024 * 1024)))
+
+fetch_cache = FetchCache(
+    ttl=timedelta(seconds=int(os.getenv("FETCH_CACHE_TTL", str(24 * 60 * 60)))),
+    max_entries=int(os.getenv("FETCH_CACHE_MAX_ENTRIES", "1000")),
+)
 
 
 class WebsiteService:
-    def __init__(self, shortener_service):
+    def __init__(
+        self,
+        shortener_service,
+        snapshots: SnapshotStore = webring_snapshots,
+        fetcher: Fetcher = scraper,
+        cache: FetchCache = fetch_cache,
+    ):
         self.shortener_service = shortener_service
+        self.snapshots = snapshots
+        self.fetcher = fetcher
+        self.fetch_cache = cache
 
     def get_all_websites(self):
-        websites = Website.query.all()
+        websites = self._websites_query().order_by(Website.id).all()
 
         return websites
 
+    def get_websites_page(self, limit: int | None, after: str | None):
+        return paginate(self._websites_query(), Website.id, limit, after)
+
+    def search_websites(
+        self, text: str | None, keyword_names: list[str], limit: int | None, after: str | None
+    ):
+        """Websites matching ``text`` and tagged with every keyword in ``keyword_names``.
+
+        With a text, results are ranked by relevance; otherwise they come in id order.
+        """
+        query = self._websites_query()
+
+        if keyword_names:
+            tagged = (
+                select(website_keyword.c.website_id)
+                .join(Keyword, Keyword.id == website_keyword.c.keyword_id)
+                .where(Keyword.name.in_(keyword_names))
+                .group_by(website_keyword.c.website_id)
+                .having(func.count() == len(keyword_names))
+            )
+            query = query.filter(Website.id.in_(tagged))
+
+        if not text or not text.strip():
+            return paginate(query, Website.id, limit, after)
+
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, text)
+        # ts_rank returns a real; as double precision the score survives the cursor round trip exactly.
+        rank = cast(func.ts_rank(Website.search_vector, ts_query), Float)
+        query = query.add_columns(rank).filter(Website.search_vector.op("@@")(ts_query))
+        return paginate_ranked(query, rank, Website.id, limit, after)
+
+    def get_websites_snapshot(self) -> Snapshot:
+        return self.snapshots.get(
+            "websites",
+            lambda: [WebsiteSchema.from_orm(website).dict() for website in self.get_all_websites()],
+        )
+
+    def get_keywords_snapshot(self) -> Snapshot:
+        return self.snapshots.get(
+            "keywords",
+            lambda: [KeywordSchema.from_orm(keyword).dict() for keyword in Keyword.query.order_by(Keyword.id).all()],
+        )
+
     def get_website(self, website_id: str):
-        website = Website.query.get_or_404(website_id)
+        website = self._websites_query().get_or_404(website_id)
 
         return website
 
+    def _websites_query(self):
+        # Keywords are serialized with every website, load them in one extra query instead of one per row.
+        return Website.query.options(selectinload(Website.keywords))
+
     def pre_register_website(self, url: str) -> PreWebsite:
-        html_content = self._fetch_html(url)
-        soup = BeautifulSoup(html_content, "html.parser")
+        check_webring = os.environ.get("IS_BETA") == "false"
+        webring_url = os.environ.get("WEBRING_URL", "") if check_webring else None
+        cached_page = self._cached_page(url, webring_url)
 
-        if os.environ.get("IS_BETA") == "false":
-            self._validate_webring_link(soup)
+        deadline = self.fetcher.deadline()
+        page_request = self.fetcher.submit(
+            url, deadline, stream=True, headers=self.fetch_cache.conditional_headers(cached_page)
+        )
+        favicon_probe = self.fetcher.submit(urljoin(url, "/favicon.ico"), deadline, method="HEAD")
+
+        page = self._fetch_html(url, page_request, deadline, webring_url, cached_page)
+        manifest = self._request_manifest(page, url, deadline)
+
+        if check_webring:
+            self._validate_webring_link(page)
 
         if Website.query.filter_by(url=url).first():
             raise DuplicateWebsiteError(
                 "Esse site já existe no sistema, realize a deleção antes de fazer um novo pré-cadastro."
             )
 
+        manifest_color = self._manifest_theme_color(manifest, deadline)
         metadata = {
-            "name": self._extract_title(soup),
-            "description": self._extract_description(soup),
-            "faviconUrl": self._extract_favicon(soup, url),
-            "color": self._extract_color(soup, url),
+            **self.extract_metadata(page, url, favicon_probe, manifest_color, deadline),
             "createdAt": datetime.utcnow().isoformat(),
         }
 
@@ -59,87 +152,153 @@ class WebsiteService:
         db.session.commit()
         return pre_website
 
-    def _fetch_html(self, url: str) -> str:
+    def _cached_page(self, url: str, webring_url: str | None):
+        entry = self.fetch_cache.lookup(url)
+        # A page parsed without the webring check may have stopped before the link.
+        if entry and webring_url is not None and entry.payload.get("webring_url") != webring_url:
+            return None
+        return entry
+
+    def _fetch_html(
+        self, url: str, page_request: Future, deadline: float, webring_url: str | None, cached_page
+    ) -> PageMetadataParser:
+        """Streams the page into the parser, dropping the connection once it has what it needs.
+
+        An unchanged page (304) is served from the fetch cache without parsing.
+        """
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            return resp.text
+            with self.fetcher.result(page_request, deadline) as resp:
+                if resp.status_code == 304 and cached_page:
+                    return PageMetadataParser.from_dict(self.fetch_cache.revalidated(cached_page))
+
+                resp.raise_for_status()
+                page = PageMetadataParser(webring_url)
+                digest = hashlib.sha256()
+                size = 0
+                for text in self.fetcher.iter_text(resp, deadline, MAX_HTML_BYTES):
+                    encoded = text.encode("utf-8")
+                    digest.update(encoded)
+                    size += len(encoded)
+                    page.feed(text)
+                    if page.done:
+                        break
+                page.close()
+
+            self.fetch_cache.store(url, resp, page.to_dict(), digest.hexdigest(), size)
+            return page
+        except UnsupportedContentError:
+            raise WebringValidationError("O endereço informado não retornou uma página HTML")
         except Exception as e:
             raise WebringValidationError(f"Failed to fetch URL: {e}")
 
-    def _validate_webring_link(self, soup: BeautifulSoup) -> None:
-        webring_url = os.environ.get("WEBRING_URL", "")
-        for a in soup.find_all("a", href=True):
-            if webring_url in a["href"]:
-                return
-        raise WebringValidationError("O site não contém um link para o webring")
+    def _request_manifest(self, page: PageMetadataParser, base_url: str, deadline: float):
+        if not page.manifest_href:
+            return None
 
-    def _extract_title(self, soup: BeautifulSoup) -> str | None:
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
-        return None
+        manifest_url = urljoin(base_url, page.manifest_href)
+        cached = self.fetch_cache.lookup(manifest_url)
+        future = self.fetcher.submit(
+            manifest_url, deadline, headers=self.fetch_cache.conditional_headers(cached)
+        )
+        return manifest_url, cached, future
+
+    def _manifest_theme_color(self, manifest, deadline: float) -> str | None:
+        if not manifest:
+            return None
+
+        manifest_url, cached, future = manifest
+        try:
+            manifest_resp = self.fetcher.result(future, deadline)
+            if manifest_resp.status_code == 304 and cached:
+                return self.fetch_cache.revalidated(cached).get("theme_color")
+
+            manifest_resp.raise_for_status()
+            theme_color = json.loads(manifest_resp.text).get("theme_color")
+            self.fetch_cache.store(
+                manifest_url,
+                manifest_resp,
+                {"theme_color": theme_color},
+                hashlib.sha256(manifest_resp.content).hexdigest(),
+                len(manifest_resp.content),
+            )
+            return theme_color
+        except Exception:
+            return None
+
+    def extract_metadata(
+        self,
+        page: PageMetadataParser,
+        base_url: str,
+        favicon_probe: Future,
+        manifest_color: str | None,
+        deadline: float,
+    ) -> dict:
+        """Builds the website fields from a parsed page, without touching the database."""
+        return {
+            "name": self._extract_title(page),
+            "description": self._extract_description(page),
+            "faviconUrl": self._extract_favicon(page, base_url, favicon_probe, deadline),
+            "color": manifest_color or self._extract_color(page),
+        }
+
+    def _validate_webring_link(self, page: PageMetadataParser) -> None:
+        if not page.has_webring_link:
+            raise WebringValidationError("O site não contém um link para o webring")
 
-    def _extract_description(self, soup: BeautifulSoup) -> str | None:
+    def _extract_title(self, page: PageMetadataParser) -> str | None:
+        return page.title
+
+    def _extract_description(self, page: PageMetadataParser) -> str | None:
         selectors = [
-            {"name": "description"},
-            {"property": "og:description"},
-            {"name": "twitter:description"},
+            ("name", "description"),
+            ("property", "og:description"),
+            ("name", "twitter:description"),
         ]
-        for attrs in selectors:
-            tag = soup.find("meta", attrs=attrs)
-            if tag and tag.get("content"):
-                return tag["content"].strip()
+        for attr, value in selectors:
+            content = page.meta_content(attr, value)
+            if content:
+                return content.strip()
         return None
 
-    def _extract_favicon(self, soup: BeautifulSoup, base_url: str) -> str | None:
-        meta_image = soup.find("meta", attrs={"property": "og:image"}) or soup.find(
-            "meta", attrs={"name": "twitter:image"}
+    def _extract_favicon(
+        self, page: PageMetadataParser, base_url: str, favicon_probe: Future, deadline: float
+    ) -> str | None:
+        meta_image = page.meta_content("property", "og:image") or page.meta_content(
+            "name", "twitter:image"
         )
-        if meta_image and meta_image.get("content"):
-            return urljoin(base_url, meta_image["content"])
+        if meta_image:
+            return urljoin(base_url, meta_image)
 
-        for icon_tag in soup.find_all("link", rel=True):
-            rel = icon_tag.get("rel")
-            if rel and any("icon" in r for r in rel) and icon_tag.get("href"):
-                return urljoin(base_url, icon_tag["href"])
-        return None
+        if page.icon_hrefs:
+            return urljoin(base_url, page.icon_hrefs[0])
 
-    def _extract_color(self, soup: BeautifulSoup, base_url: str) -> str | None:
-        manifest_tag = soup.find("link", rel="manifest")
-        if manifest_tag and manifest_tag.get("href"):
-            try:
-                manifest_url = urljoin(base_url, manifest_tag["href"])
-                manifest_resp = requests.get(manifest_url, timeout=5)
-                manifest_resp.raise_for_status()
-                return json.loads(manifest_resp.text).get("theme_color")
-            except Exception:
-                pass
+        try:
+            if self.fetcher.result(favicon_probe, deadline).ok:
+                return urljoin(base_url, "/favicon.ico")
+        except Exception:
+            pass
+        return None
 
+    def _extract_color(self, page: PageMetadataParser) -> str | None:
         meta_names = ["primary-color", "theme_color", "color", "og:theme-color"]
         for name in meta_names:
-            tag = soup.find("meta", attrs={"name": name}) or soup.find(
-                "meta", attrs={"property": name}
-            )
-            if tag and tag.get("content"):
-                return tag["content"].strip()
-
-        for style_tag in soup.find_all("style"):
-            if style_tag.string:
-                match = re.search(r"--primary-color\s*:\s*([^;]+);", style_tag.string)
-                if match:
-                    return match.group(1).strip()
-
-        if soup.head:
-            for tag in soup.head.find_all(True):
-                style = tag.get("style")
-                if style:
-                    match = re.search(r"color\s*:\s*([^;]+);", style)
-                    if match:
-                        return match.group(1).strip()
-
-        theme_color_tag = soup.find("meta", attrs={"name": "theme-color"})
-        if theme_color_tag and theme_color_tag.get("content"):
-            return theme_color_tag["content"].strip()
+            content = page.meta_content("name", name) or page.meta_content("property", name)
+            if content:
+                return content.strip()
+
+        for style in page.styles:
+            match = PRIMARY_COLOR_RE.search(style)
+            if match:
+                return match.group(1).strip()
+
+        for style in page.head_inline_styles:
+            match = INLINE_COLOR_RE.search(style)
+            if match:
+                return match.group(1).strip()
+
+        theme_color = page.meta_content("name", "theme-color")
+        if theme_color:
+            return theme_color.strip()
 
         return None
 
@@ -175,6 +334,7 @@ class WebsiteService:
         db.session.add(website)
         db.session.delete(pre_website)
         db.session.commit()
+        self.snapshots.invalidate()
 
         return website
 
@@ -183,12 +343,16 @@ class WebsiteService:
         if not website:
             raise NotFoundError("Site não encontrado")
 
+        deleted = [Website]
         for keyword in list(website.keywords):
             if len(keyword.websites) == 1 and keyword.websites[0].id == website.id:
                 db.session.delete(keyword)
+                deleted = [Website, Keyword]
 
         db.session.delete(website)
+        mark_deleted(*deleted)
         db.session.commit()
+        self.snapshots.invalidate()
 
 
 class WebringValidationError(Exception):
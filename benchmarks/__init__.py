@@ -0,0 +1,48 @@
+"""Throughput benchmarks that run the app in-process against a disposable Postgres.
+
+Run them with the same POSTGRES_* variables as the tests, e.g.
+``POSTGRES_DB=webring_test python -m benchmarks.shorten``.
+"""
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+
+
+def bench_app():
+    """Creates the app on an empty database; refuses anything not named *_test."""
+    # Imported here so a benchmark can set env vars before the app modules read them.
+    from app import create_app
+    from app.models.database import DB_NAME, create_schema, db
+
+    if not (DB_NAME or "").endswith("_test"):
+        raise SystemExit("POSTGRES_DB deve apontar para um banco de testes, com nome terminado em _test")
+
+    app = create_app()
+    with app.app_context():
+        create_schema()
+        tables = ", ".join(f'"{table.name}"' for table in db.metadata.sorted_tables)
+        db.session.execute(text(f"TRUNCATE {tables} CASCADE"))
+        db.session.commit()
+    return app
+
+
+def run_concurrently(request, total: int, threads: int) -> tuple[float, list]:
+    """Calls ``request(i)`` for i in range(total) from ``threads`` threads.
+
+    Returns the elapsed seconds and what each call returned, in order.
+    """
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(request, range(total)))
+    return time.perf_counter() - started, results
+
+
+def report(name: str, statuses: list[int], threads: int, elapsed: float) -> None:
+    total = len(statuses)
+    print(
+        f"{name}: {total} requisições, {threads} threads, "
+        f"{total / elapsed:,.0f} req/s, {elapsed / total * 1000 * threads:.2f} ms por requisição, "
+        f"status {dict(Counter(statuses))}"
+    )
@@ -0,0 +1,80 @@
+"""base62 codec throughput: the table-driven functions against the digit-by-digit codec they replaced.
+
+Ids are spread over the whole range short codes use, from one digit up to
+MAX_MAPPING_ID, and the batch functions run on the same ids in lists of
+``--batch``. No database is touched.
+"""
+import argparse
+import random
+import time
+
+from app.lib.base62 import (
+    CHARS,
+    decode_base62,
+    decode_base62_many,
+    encode_base62,
+    encode_base62_many,
+    try_decode_base62,
+)
+from app.services.shortener import MAX_MAPPING_ID
+
+
+def digitwise_encode(num: int) -> str:
+    """The original encoder, one divmod and one string concatenation per digit."""
+    if num == 0:
+        return CHARS[0]
+
+    encoding = ""
+    while num > 0:
+        num, remainder = divmod(num, 62)
+        encoding = CHARS[remainder] + encoding
+    return encoding
+
+
+def digitwise_decode(short_url: str) -> int:
+    """The original decoder, a linear CHARS.index lookup per character and no validation."""
+    num = 0
+    for char in short_url:
+        num = num * 62 + CHARS.index(char)
+    return num
+
+
+def timed(name: str, operations: int, action) -> None:
+    started = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - started
+    print(f"{name}: {operations / elapsed:,.0f} op/s, {elapsed / operations * 1e9:,.0f} ns por operação")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ids", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=62)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # Uniform over the number of digits, otherwise almost every id would have the maximum length.
+    lengths = [rng.randint(2, 6) for _ in range(args.ids)]
+    ids = [rng.randrange(62 ** (length - 1), min(62 ** length, MAX_MAPPING_ID)) for length in lengths]
+    codes = [encode_base62(num) for num in ids]
+    batches = [ids[start:start + args.batch] for start in range(0, len(ids), args.batch)]
+    code_batches = [codes[start:start + args.batch] for start in range(0, len(codes), args.batch)]
+    # At least 12 characters, past MAX_CODE_LENGTH.
+    too_long = [code * 6 for code in codes]
+
+    assert [digitwise_encode(num) for num in ids] == codes
+    assert decode_base62_many(codes) == ids
+
+    timed("encode_base62 (por dígito)", len(ids), lambda: [digitwise_encode(num) for num in ids])
+    timed("encode_base62", len(ids), lambda: [encode_base62(num) for num in ids])
+    timed(f"encode_base62_many ({args.batch} por lote)", len(ids), lambda: [encode_base62_many(batch) for batch in batches])
+    timed("decode_base62 (por dígito)", len(codes), lambda: [digitwise_decode(code) for code in codes])
+    timed("decode_base62", len(codes), lambda: [decode_base62(code) for code in codes])
+    timed(f"decode_base62_many ({args.batch} por lote)", len(codes), lambda: [decode_base62_many(batch) for batch in code_batches])
+    timed("código longo demais (por dígito)", len(too_long), lambda: [digitwise_decode(code) for code in too_long])
+    timed("código longo demais, rejeitado", len(too_long), lambda: [try_decode_base62(code) for code in too_long])
+
+
+if __name__ == "__main__":
+    main()
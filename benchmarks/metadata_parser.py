@@ -0,0 +1,139 @@
+"""Metadata extraction time per page: the BeautifulSoup helpers used before PageMetadataParser, against the parser.
+
+Runs on the pages saved in benchmarks/pages, and on copies of them padded to
+``--padding`` KB of body before the webring link, like a long blog index.
+Needs beautifulsoup4, which the app itself no longer uses; no database is touched.
+"""
+import argparse
+import re
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from app.lib.metadata_parser import PageMetadataParser
+from app.services.website import WebsiteService
+
+PAGES_DIR = Path(__file__).parent / "pages"
+BASE_URL = "https://exemplo.com.br/blog/"
+WEBRING_URL = "https://nosnocabo.com"
+PADDING_PARAGRAPH = "<p>Lorem ipsum dolor sit amet, <a href='/post'>consectetur</a> adipiscing elit.</p>\n"
+
+
+def sample_pages() -> dict[str, str]:
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(PAGES_DIR.glob("*.html"))}
+
+
+def padded(html: str, size_kb: int) -> str:
+    """Inserts filler paragraphs right after <body>, so the webring link comes last."""
+    filler = PADDING_PARAGRAPH * (size_kb * 1024 // len(PADDING_PARAGRAPH))
+    return re.sub(r"(<body[^>]*>)", lambda match: match.group(1) + filler, html, count=1)
+
+
+def soup_metadata(html: str, base_url: str = BASE_URL, webring_url: str = WEBRING_URL) -> dict:
+    """The values the pre-PageMetadataParser helpers extracted, with no favicon probe or manifest response."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    title = soup.title.string.strip() if soup.title and soup.title.string else None
+
+    description = None
+    for attrs in ({"name": "description"}, {"property": "og:description"}, {"name": "twitter:description"}):
+        tag = soup.find("meta", attrs=attrs)
+        if tag and tag.get("content"):
+            description = tag["content"].strip()
+            break
+
+    favicon = None
+    meta_image = soup.find("meta", attrs={"property": "og:image"}) or soup.find("meta", attrs={"name": "twitter:image"})
+    if meta_image and meta_image.get("content"):
+        favicon = urljoin(base_url, meta_image["content"])
+    else:
+        for icon_tag in soup.find_all("link", rel=True):
+            rel = icon_tag.get("rel")
+            if rel and any("icon" in r for r in rel) and icon_tag.get("href"):
+                favicon = urljoin(base_url, icon_tag["href"])
+                break
+
+    manifest_tag = soup.find("link", rel="manifest")
+    manifest = manifest_tag["href"] if manifest_tag and manifest_tag.get("href") else None
+
+    return {
+        "name": title,
+        "description": description,
+        "faviconUrl": favicon,
+        "color": _soup_color(soup),
+        "manifest": manifest,
+        "has_webring_link": any(webring_url in a["href"] for a in soup.find_all("a", href=True)),
+    }
+
+
+def _soup_color(soup: BeautifulSoup) -> str | None:
+    for name in ["primary-color", "theme_color", "color", "og:theme-color"]:
+        tag = soup.find("meta", attrs={"name": name}) or soup.find("meta", attrs={"property": name})
+        if tag and tag.get("content"):
+            return tag["content"].strip()
+
+    for style_tag in soup.find_all("style"):
+        if style_tag.string:
+            match = re.search(r"--primary-color\s*:\s*([^;]+);", style_tag.string)
+            if match:
+                return match.group(1).strip()
+
+    if soup.head:
+        for tag in soup.head.find_all(True):
+            style = tag.get("style")
+            if style:
+                match = re.search(r"color\s*:\s*([^;]+);", style)
+                if match:
+                    return match.group(1).strip()
+
+    theme_color_tag = soup.find("meta", attrs={"name": "theme-color"})
+    if theme_color_tag and theme_color_tag.get("content"):
+        return theme_color_tag["content"].strip()
+    return None
+
+
+def parser_metadata(html: str, base_url: str = BASE_URL, webring_url: str = WEBRING_URL) -> dict:
+    """The same values through PageMetadataParser and the service's extract_metadata."""
+    page = PageMetadataParser(webring_url)
+    page.feed(html)
+    page.close()
+
+    failed_probe = Future()
+    failed_probe.set_exception(ConnectionError("sem rede no benchmark"))
+    metadata = WebsiteService(shortener_service=None).extract_metadata(page, base_url, failed_probe, None, time.monotonic() + 1)
+    return {**metadata, "manifest": page.manifest_href, "has_webring_link": page.has_webring_link}
+
+
+def best_time(extract, html: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        extract(html)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--padding", type=int, default=300, help="KB de conteúdo antes do link do webring")
+    args = parser.parse_args()
+
+    pages = sample_pages()
+    pages.update({f"{name} +{args.padding} KB": padded(html, args.padding) for name, html in list(pages.items())})
+
+    for name, html in pages.items():
+        same = soup_metadata(html) == parser_metadata(html)
+        soup_ms = best_time(soup_metadata, html, args.repeat) * 1000
+        parser_ms = best_time(parser_metadata, html, args.repeat) * 1000
+        print(
+            f"{name}: {len(html) / 1024:,.0f} KB, BeautifulSoup {soup_ms:.2f} ms, "
+            f"PageMetadataParser {parser_ms:.2f} ms, mesmos valores: {'sim' if same else 'NÃO'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""GET /nos/<code> throughput when every click is written directly (CLICK_BUFFER=false).
+
+All requests hit the same short code, the worst case for row contention, and
+the final click_count shows whether any click was lost.
+"""
+import argparse
+import os
+
+from benchmarks import bench_app, report, run_concurrently
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    os.environ["CLICK_BUFFER"] = "false"
+    app = bench_app()
+    short_url = app.test_client().post("/shorten", json={"url": "https://example.com/"}).get_json()["short_url"]
+
+    def redirect(_: int) -> int:
+        return app.test_client().get(f"/nos/{short_url}").status_code
+
+    elapsed, statuses = run_concurrently(redirect, args.requests, args.threads)
+    report(f"GET /nos/{short_url}", statuses, args.threads, elapsed)
+
+    from app.models.URL_analytics import URLAnalytics
+
+    with app.app_context():
+        analytics = URLAnalytics.query.filter_by(short_url=short_url).first()
+    print(f"click_count: {analytics.click_count if analytics else 0} de {args.requests}")
+
+
+if __name__ == "__main__":
+    main()
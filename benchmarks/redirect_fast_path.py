@@ -0,0 +1,56 @@
+"""GET /nos/<code> throughput for cached codes, with REDIRECT_FAST_PATH on and off.
+
+Every code is resolved once before timing, so the measured redirects are all
+cache hits: with the fast path they are answered by the WSGI middleware, without
+it by the Flask view. Clicks stay buffered (CLICK_BUFFER=true), which the fast
+path requires. Without ``--fast-path`` both modes run, each in its own process,
+since the flag is read when the app is imported.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks import bench_app, report, run_concurrently
+
+
+def run(fast_path: bool, total: int, threads: int, codes: int) -> None:
+    os.environ["REDIRECT_FAST_PATH"] = "true" if fast_path else "false"
+    os.environ["CLICK_BUFFER"] = "true"
+    app = bench_app()
+    client = app.test_client()
+    short_urls = [
+        client.post("/shorten", json={"url": f"https://example.com/redirect/{index}"}).get_json()["short_url"]
+        for index in range(codes)
+    ]
+    for short_url in short_urls:
+        client.get(f"/nos/{short_url}")
+
+    def redirect(index: int) -> int:
+        return app.test_client().get(f"/nos/{short_urls[index % codes]}").status_code
+
+    elapsed, statuses = run_concurrently(redirect, total, threads)
+    report(f"GET /nos/<código> com REDIRECT_FAST_PATH={os.environ['REDIRECT_FAST_PATH']}", statuses, threads, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--codes", type=int, default=100)
+    parser.add_argument("--fast-path", choices=["on", "off"])
+    args = parser.parse_args()
+
+    if args.fast_path:
+        run(args.fast_path == "on", args.requests, args.threads, args.codes)
+        return
+
+    for mode in ("off", "on"):
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.redirect_fast_path", *sys.argv[1:], "--fast-path", mode],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
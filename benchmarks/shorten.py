@@ -0,0 +1,29 @@
+"""POST /shorten throughput with distinct URLs, so every request creates a mapping."""
+import argparse
+
+from app.models.URL_mapping import URLMapping
+from benchmarks import bench_app, report, run_concurrently
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    app = bench_app()
+
+    def shorten(index: int) -> int:
+        return app.test_client().post("/shorten", json={"url": f"https://example.com/bench/{index}"}).status_code
+
+    elapsed, statuses = run_concurrently(shorten, args.requests, args.threads)
+    report("POST /shorten", statuses, args.threads, elapsed)
+
+    with app.app_context():
+        created = URLMapping.query.count()
+        codes = {short_url for short_url, in URLMapping.query.with_entities(URLMapping.short_url)}
+    print(f"mapeamentos criados: {created}, códigos distintos: {len(codes)}")
+
+
+if __name__ == "__main__":
+    main()
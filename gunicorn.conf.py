@@ -0,0 +1,33 @@
+import multiprocessing
+import os
+
+# Every setting can be overridden through the environment, see "Execução em produção" in the README.
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '3000')}")
+workers = int(os.getenv("GUNICORN_WORKERS", str(multiprocessing.cpu_count() * 2 + 1)))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+
+# Keep-alive lets the reverse proxy reuse connections to the workers.
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+# Recycle workers periodically; the jitter keeps them from restarting all at once.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+# Builds create_app() once in the master and forks it, instead of once per worker.
+preload_app = os.getenv("GUNICORN_PRELOAD", "true") == "true"
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+
+
+def post_fork(server, worker):
+  # Connections opened by the master while preloading must not be shared with the workers.
+  # close=False drops them from the worker's pool without closing the sockets the master still uses.
+  from app.models.database import db
+  from wsgi import app
+
+  for bind in [None, *app.config["SQLALCHEMY_BINDS"]]:
+    db.get_engine(app, bind=bind).dispose(close=False)
@@ -0,0 +1,69 @@
+import threading
+import unittest
+
+from sqlalchemy import event, text
+
+from app import create_app
+from app.models.database import DB_NAME, create_schema, db
+from app.services.click_aggregator import click_aggregator
+from app.services.shortener import mapping_cache
+from app.services.website import webring_snapshots
+
+# Every test truncates all tables, so the suite refuses to run against a real database.
+if not (DB_NAME or "").endswith("_test"):
+    raise RuntimeError("POSTGRES_DB deve apontar para um banco de testes, com nome terminado em _test")
+
+app = create_app()
+
+
+def truncate_tables() -> None:
+    # Buffered clicks would otherwise be written after their mappings are gone.
+    click_aggregator.flush()
+    tables = ", ".join(f'"{table.name}"' for table in db.metadata.sorted_tables)
+    db.session.execute(text(f"TRUNCATE {tables} CASCADE"))
+    db.session.commit()
+    db.session.remove()
+    mapping_cache.clear()
+    webring_snapshots.invalidate()
+
+
+with app.app_context():
+    create_schema()
+    truncate_tables()
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Runs each test in an app context against an empty Postgres database."""
+
+    def setUp(self):
+        self.client = app.test_client()
+        self.app_context = app.app_context()
+        self.app_context.push()
+
+    def tearDown(self):
+        db.session.remove()
+        truncate_tables()
+        self.app_context.pop()
+
+    def count_statements(self, action) -> int:
+        """Runs ``action`` and returns how many SQL statements it sent to the database."""
+        return len(self.record_statements(action))
+
+    def record_statements(self, action) -> list[str]:
+        """Runs ``action`` and returns the SQL statements it sent to the database, in order.
+
+        Statements from other threads, such as the scrape job workers, are not recorded.
+        """
+        statements = []
+        thread_id = threading.get_ident()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if threading.get_ident() == thread_id:
+                statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            action()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        return statements
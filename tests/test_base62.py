@@ -0,0 +1,52 @@
+import unittest
+
+from app.lib.base62 import (
+    CHARS,
+    MAX_CODE_LENGTH,
+    decode_base62,
+    decode_base62_many,
+    encode_base62,
+    encode_base62_many,
+    try_decode_base62,
+)
+from app.services.shortener import MAX_MAPPING_ID
+
+
+class Base62Test(unittest.TestCase):
+    def test_round_trip(self):
+        ids = [0, 1, 61, 62, 63, 3843, 3844, 3845, 62**5 - 1, 62**5, MAX_MAPPING_ID, 2**63 - 1]
+        for num in ids:
+            with self.subTest(num=num):
+                self.assertEqual(decode_base62(encode_base62(num)), num)
+
+        self.assertEqual(encode_base62_many(ids), [encode_base62(num) for num in ids])
+        self.assertEqual(decode_base62_many(encode_base62_many(ids)), ids)
+
+    def test_codes_follow_the_alphabet(self):
+        self.assertEqual(encode_base62(0), "a")
+        self.assertEqual(encode_base62(61), "9")
+        self.assertEqual(encode_base62(62), "ba")
+        self.assertEqual(len(encode_base62(2**63 - 1)), MAX_CODE_LENGTH)
+
+    def test_invalid_codes_are_rejected(self):
+        invalid = {
+            "zero à esquerda": "ab",
+            "vazio": "",
+            "longo demais": "b" * (MAX_CODE_LENGTH + 1),
+            "hífen": "ab-c",
+            "espaço": "bc d",
+            "acento": "bçd",
+        }
+        for reason, code in invalid.items():
+            with self.subTest(reason=reason):
+                self.assertIsNone(try_decode_base62(code))
+                with self.assertRaises(ValueError):
+                    decode_base62(code)
+
+        self.assertEqual(try_decode_base62("a"), 0)
+        self.assertEqual(try_decode_base62(CHARS[-1] * MAX_CODE_LENGTH), 62**MAX_CODE_LENGTH - 1)
+
+    def test_batch_decode_keeps_order_with_none_for_invalid_codes(self):
+        codes = ["b", "", "ab", encode_base62(MAX_MAPPING_ID), "b" * 12, "x!", "ba"]
+
+        self.assertEqual(decode_base62_many(codes), [1, None, None, MAX_MAPPING_ID, None, None, 62])
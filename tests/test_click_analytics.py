@@ -0,0 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from app.models.URL_analytics import URLAnalytics
+from app.services.shortener import URLShortenerService
+from tests.base import DatabaseTestCase, app
+
+PARALLEL_REDIRECTS = 200
+
+
+class ClickAnalyticsTest(DatabaseTestCase):
+    def test_parallel_redirects_count_every_click(self):
+        short_url = URLShortenerService().create_mapping("https://example.com/").short_url
+
+        def redirect(_):
+            return app.test_client().get(f"/nos/{short_url}").status_code
+
+        # Without the buffer each redirect upserts url_analytics itself, the path that used to lose clicks.
+        with mock.patch("app.services.shortener.BUFFER_CLICKS", False):
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                statuses = list(pool.map(redirect, range(PARALLEL_REDIRECTS)))
+
+        self.assertEqual(statuses, [302] * PARALLEL_REDIRECTS)
+        analytics = URLAnalytics.query.filter_by(short_url=short_url).one()
+        self.assertEqual(analytics.click_count, PARALLEL_REDIRECTS)
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+from app.models.database import db
+from app.models.URL_click_bucket import DAY, HOUR, URLClickBucket
+from app.services.shortener import URLShortenerService
+from tests.base import DatabaseTestCase
+
+TODAY = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+OLD_DAY = TODAY - timedelta(days=10)
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+def add_bucket(short_url, granularity, bucket_start, click_count):
+    db.session.add(URLClickBucket(short_url=short_url, granularity=granularity, bucket_start=bucket_start, click_count=click_count))
+
+
+class ClickRollupTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.service = URLShortenerService()
+        self.short_url = self.service.create_mapping("https://example.com/").short_url
+
+    def buckets(self):
+        rows = URLClickBucket.query.filter_by(short_url=self.short_url).order_by(URLClickBucket.bucket_start)
+        return [(row.granularity, row.bucket_start, row.click_count) for row in rows]
+
+    def test_rollup_moves_old_hours_into_daily_sums(self):
+        add_bucket(self.short_url, HOUR, OLD_DAY + timedelta(hours=1), 3)
+        add_bucket(self.short_url, HOUR, OLD_DAY + timedelta(hours=5), 4)
+        add_bucket(self.short_url, HOUR, OLD_DAY + timedelta(days=1, hours=2), 2)
+        add_bucket(self.short_url, HOUR, TODAY + timedelta(hours=1), 7)
+        db.session.commit()
+
+        self.service.rollup_click_buckets(timedelta(days=7))
+
+        self.assertEqual(self.buckets(), [
+            (DAY, OLD_DAY, 7),
+            (DAY, OLD_DAY + timedelta(days=1), 2),
+            (HOUR, TODAY + timedelta(hours=1), 7),
+        ])
+
+    def test_rollup_adds_to_an_existing_daily_bucket(self):
+        add_bucket(self.short_url, DAY, OLD_DAY, 10)
+        add_bucket(self.short_url, HOUR, OLD_DAY + timedelta(hours=3), 5)
+        db.session.commit()
+
+        self.service.rollup_click_buckets(timedelta(days=7))
+        self.service.rollup_click_buckets(timedelta(days=7))
+
+        self.assertEqual(self.buckets(), [(DAY, OLD_DAY, 15)])
+
+
+class ClickTimeseriesRouteTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.short_url = URLShortenerService().create_mapping("https://example.com/").short_url
+        add_bucket(self.short_url, DAY, OLD_DAY, 10)
+        add_bucket(self.short_url, HOUR, YESTERDAY + timedelta(hours=2), 3)
+        add_bucket(self.short_url, HOUR, YESTERDAY + timedelta(hours=5), 4)
+        db.session.commit()
+
+    def timeseries(self, **query):
+        return self.client.get(f"/shorteners/analytics/{self.short_url}/timeseries", query_string=query)
+
+    def test_daily_points_sum_hours_and_rolled_up_days(self):
+        response = self.timeseries(granularity="day")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["granularity"], "day")
+        self.assertEqual([point["click_count"] for point in response.json["points"]], [10, 7])
+
+    def test_hourly_points_within_the_interval(self):
+        start = YESTERDAY
+        response = self.timeseries(granularity="hour", start=start.isoformat(), end=TODAY.isoformat())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([point["click_count"] for point in response.json["points"]], [3, 4])
+
+    def test_start_after_end_is_rejected(self):
+        response = self.timeseries(start=TODAY.isoformat(), end=OLD_DAY.isoformat())
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_code_is_not_found(self):
+        response = self.client.get("/shorteners/analytics/zzzzzz/timeseries")
+
+        self.assertEqual(response.status_code, 404)
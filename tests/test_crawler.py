@@ -0,0 +1,89 @@
+from datetime import datetime
+from unittest import mock
+
+from app.models.database import db
+from app.models.website import Website
+from app.models.website_health import WebsiteHealth
+from app.services.crawler import CrawlResult, WebsiteCrawler
+from app.services.shortener import URLShortenerService
+from app.services.website import WebsiteService
+from tests.base import DatabaseTestCase
+
+
+class WebsiteCrawlerTest(DatabaseTestCase):
+    def add_website(self, name: str, url: str | None = None) -> int:
+        now = datetime.utcnow().isoformat()
+        website = Website(
+            name=name,
+            url=url or f"https://{name}.example.com",
+            description="",
+            color="",
+            faviconUrl="",
+            createdAt=now,
+            updatedAt=now,
+        )
+        db.session.add(website)
+        db.session.commit()
+        return website.id
+
+    def test_websites_deleted_during_the_crawl_are_skipped(self):
+        kept_id = self.add_website("mantido")
+        deleted_id = self.add_website("removido")
+        engine = db.engine
+
+        def crawl(website_id, url):
+            if website_id == deleted_id:
+                # Another request deletes the website while the crawl is running.
+                with engine.begin() as connection:
+                    connection.execute(Website.__table__.delete().where(Website.id == deleted_id))
+            return CrawlResult(website_id=website_id, status_code=200, latency_ms=5, metadata={"name": "Novo nome"})
+
+        crawler = WebsiteCrawler(WebsiteService(URLShortenerService()), concurrency=2, host_delay=0)
+        with mock.patch.object(crawler, "crawl", side_effect=crawl):
+            summary = crawler.run()
+
+        self.assertEqual(summary, {"checked": 1, "updated": 1, "unhealthy": []})
+        self.assertEqual(db.session.get(Website, kept_id).name, "Novo nome")
+        self.assertEqual([health.website_id for health in WebsiteHealth.query.all()], [kept_id])
+
+    def test_short_codes_are_resolved_in_one_query(self):
+        shortener = URLShortenerService()
+        for index in range(5):
+            short_url = shortener.create_mapping(f"https://site-{index}.example.com/").short_url
+            self.add_website(f"site-{index}", url=short_url)
+        self.add_website("sem-mapeamento", url="zzzz")
+        crawled = {}
+
+        def crawl(website_id, url):
+            crawled[website_id] = url
+            return CrawlResult(website_id=website_id, status_code=200, latency_ms=5)
+
+        crawler = WebsiteCrawler(WebsiteService(shortener), concurrency=2, host_delay=0)
+        with mock.patch.object(crawler, "crawl", side_effect=crawl):
+            # Websites, mappings, the existence check and the health upsert.
+            self.assertEqual(self.count_statements(crawler.run), 4)
+
+        self.assertEqual(
+            sorted(url for url in crawled.values() if url),
+            [f"https://site-{index}.example.com/" for index in range(5)],
+        )
+        self.assertEqual(list(crawled.values()).count(None), 1)
+
+    def test_values_longer_than_their_column_are_skipped(self):
+        long_id = self.add_website("longo")
+        other_id = self.add_website("outro")
+
+        def crawl(website_id, url):
+            description = "x" * 1001 if website_id == long_id else "Nova descrição"
+            metadata = {"name": "Nome novo", "description": description}
+            return CrawlResult(website_id=website_id, status_code=200, latency_ms=5, metadata=metadata)
+
+        crawler = WebsiteCrawler(WebsiteService(URLShortenerService()), concurrency=2, host_delay=0)
+        with mock.patch.object(crawler, "crawl", side_effect=crawl):
+            summary = crawler.run()
+
+        self.assertEqual(summary["updated"], 2)
+        long_website = db.session.get(Website, long_id)
+        self.assertEqual((long_website.name, long_website.description), ("Nome novo", ""))
+        self.assertEqual(db.session.get(Website, other_id).description, "Nova descrição")
+        self.assertEqual(WebsiteHealth.query.count(), 2)
@@ -0,0 +1,116 @@
+from unittest import mock
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy_utils import create_database, database_exists
+
+from app.lib.base62 import encode_base62
+from app.lib.db_routing import read_only
+from app.models.database import DATABASE_URL, DB_NAME, db
+from app.models.URL_mapping import URLMapping
+from app.services.shortener import URLShortenerService
+from tests.base import DatabaseTestCase, app
+
+# A second database on the same server stands in for the replica; rows written
+# only there, or only on the primary, show which one a read went to.
+REPLICA_URL = make_url(DATABASE_URL).set(database=DB_NAME.removesuffix("_test") + "_replica_test")
+UNREACHABLE_URL = make_url(DATABASE_URL).set(port=1)
+BINDS = {
+    "replica_0": REPLICA_URL.render_as_string(hide_password=False),
+    "replica_down": UNREACHABLE_URL.render_as_string(hide_password=False),
+}
+REPLICA_ONLY = encode_base62(1001)
+PRIMARY_ONLY = encode_base62(1002)
+
+
+def add_mapping(connection, url_id: int) -> None:
+    connection.execute(URLMapping.__table__.insert().values(
+        id=url_id,
+        short_url=encode_base62(url_id),
+        original_url=f"https://example.com/{url_id}",
+        url_fingerprint=str(url_id),
+        created_at=db.func.now(),
+    ))
+
+
+class ReplicaRoutingTest(DatabaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not database_exists(REPLICA_URL):
+            create_database(REPLICA_URL)
+        cls.binds = mock.patch.dict(app.config["SQLALCHEMY_BINDS"], BINDS)
+        cls.binds.start()
+        with app.app_context():
+            db.Model.metadata.create_all(db.get_engine(app, bind="replica_0"))
+
+    @classmethod
+    def tearDownClass(cls):
+        with app.app_context():
+            db.get_engine(app, bind="replica_0").dispose()
+        cls.binds.stop()
+
+    def setUp(self):
+        super().setUp()
+        self.replica = db.get_engine(app, bind="replica_0")
+        self.router_state = [
+            mock.patch.object(db.router, "bind_keys", ["replica_0"]),
+            mock.patch.object(db.router, "_next", 0),
+            mock.patch.object(db.router, "_checked_at", {}),
+            mock.patch.object(db.router, "_down_until", {}),
+        ]
+        for patch in self.router_state:
+            patch.start()
+
+        with self.replica.begin() as connection:
+            add_mapping(connection, 1001)
+        with db.engine.begin() as connection:
+            add_mapping(connection, 1002)
+
+    def tearDown(self):
+        # Ends the session's replica transaction, which would block the TRUNCATE.
+        db.session.remove()
+        for patch in reversed(self.router_state):
+            patch.stop()
+        with self.replica.begin() as connection:
+            connection.execute(text("TRUNCATE url_mappings CASCADE"))
+        super().tearDown()
+
+    def visible_codes(self) -> set[str]:
+        return set(db.session.scalars(select(URLMapping.short_url)))
+
+    def test_reads_inside_read_only_go_to_the_replica(self):
+        self.assertEqual(self.visible_codes(), {PRIMARY_ONLY})
+        with read_only():
+            self.assertEqual(self.visible_codes(), {REPLICA_ONLY})
+
+    def test_reads_after_a_flush_stay_on_the_primary(self):
+        with read_only():
+            db.session.add(URLMapping(id=1003, short_url="novo", original_url="https://example.com/novo", url_fingerprint="novo"))
+            db.session.flush()
+            self.assertEqual(self.visible_codes(), {PRIMARY_ONLY, "novo"})
+
+    def test_reads_after_a_locking_read_stay_on_the_primary(self):
+        with read_only():
+            db.session.scalars(select(URLMapping.id).where(URLMapping.id == 1002).with_for_update()).all()
+            self.assertEqual(self.visible_codes(), {PRIMARY_ONLY})
+
+    def test_replica_marked_down_falls_back_to_the_primary(self):
+        db.router._mark_down("replica_0")
+
+        with read_only():
+            self.assertEqual(self.visible_codes(), {PRIMARY_ONLY})
+        self.assertEqual(db.router.status(), {"replica_0": False})
+
+    def test_unreachable_replica_is_skipped(self):
+        with mock.patch.object(db.router, "bind_keys", ["replica_down", "replica_0"]):
+            with read_only():
+                self.assertEqual(self.visible_codes(), {REPLICA_ONLY})
+            self.assertEqual(db.router.status(), {"replica_down": False, "replica_0": True})
+
+    def test_get_mapping_retries_on_the_primary_when_the_replica_misses(self):
+        service = URLShortenerService()
+
+        self.assertEqual(service.get_mapping(REPLICA_ONLY).id, 1001)
+        # Created moments ago and not replicated yet.
+        self.assertEqual(service.get_mapping(PRIMARY_ONLY).id, 1002)
+        self.assertIsNone(service.get_mapping(encode_base62(1003)))
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from app.models.database import db
+from app.models.fetch_cache import FetchCacheEntry
+from app.models.keyword import Keyword
+from app.services.fetch_cache import FetchCache
+from tests.base import DatabaseTestCase
+
+
+class FakeResponse:
+    def __init__(self, **headers):
+        self.headers = headers
+
+
+class FetchCacheStoreTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = FetchCache(ttl=timedelta(hours=1), max_entries=10)
+        now = datetime.utcnow().isoformat()
+        # Pending work of the request that triggered the fetch; a cache failure must not lose it.
+        db.session.add(Keyword(name="python", createdAt=now, updatedAt=now))
+
+    def assert_request_survives(self):
+        db.session.commit()
+        self.assertEqual(Keyword.query.count(), 1)
+
+    def test_values_longer_than_their_columns_are_not_cached(self):
+        cases = [
+            ("https://example.com/" + "a" * 2048, FakeResponse()),
+            ("https://example.com/", FakeResponse(ETag="x" * 301)),
+            ("https://example.com/", FakeResponse(**{"Last-Modified": "x" * 101})),
+        ]
+        for url, response in cases:
+            with self.subTest(url=url[:40], headers=list(response.headers)):
+                self.cache.store(url, response, {}, "digest", 0)
+                self.assertIsNone(db.session.get(FetchCacheEntry, url))
+
+        self.assert_request_survives()
+
+    def test_failed_write_leaves_the_transaction_usable(self):
+        # body_digest is a String(64); Postgres rejects the row inside the savepoint.
+        self.cache.store("https://example.com/", FakeResponse(), {}, "x" * 65, 0)
+
+        self.assert_request_survives()
+        self.assertIsNone(db.session.get(FetchCacheEntry, "https://example.com/"))
+
+    def test_successful_write_is_cached(self):
+        self.cache.store("https://example.com/", FakeResponse(ETag='"v1"'), {"title": "Exemplo"}, "digest", 10)
+
+        self.assert_request_survives()
+        self.assertEqual(db.session.get(FetchCacheEntry, "https://example.com/").etag, '"v1"')
@@ -0,0 +1,76 @@
+import threading
+import tracemalloc
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.lib.fetcher import Fetcher, UnsupportedContentError
+from app.lib.metadata_parser import PageMetadataParser
+from app.services.website import MAX_HTML_BYTES
+
+PARAGRAPH = "<p>Conteúdo que nunca acaba, sem link para o webring.</p>\n".encode()
+
+
+class EndlessPageHandler(BaseHTTPRequestHandler):
+    """Streams paragraphs until the client hangs up, with the Content-Type taken from the path."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf" if self.path == "/arquivo.pdf" else "text/html; charset=utf-8")
+        self.end_headers()
+        body = PARAGRAPH * 256
+        try:
+            while True:
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FetcherStreamingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), EndlessPageHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.fetcher = Fetcher(max_workers=2, request_timeout=10, deadline=20)
+
+    def test_endless_body_stops_at_the_byte_cap(self):
+        deadline = self.fetcher.deadline()
+        with self.fetcher.request(f"{self.base_url}/", deadline, stream=True) as resp:
+            received = sum(len(text.encode()) for text in self.fetcher.iter_text(resp, deadline, MAX_HTML_BYTES))
+
+        # Characters cut in half at the cap decode to one replacement character.
+        self.assertLessEqual(abs(received - MAX_HTML_BYTES), 3)
+
+    def test_non_html_is_rejected_before_the_body_is_read(self):
+        deadline = self.fetcher.deadline()
+        with self.fetcher.request(f"{self.base_url}/arquivo.pdf", deadline, stream=True) as resp:
+            with self.assertRaises(UnsupportedContentError):
+                next(self.fetcher.iter_text(resp, deadline, MAX_HTML_BYTES))
+            self.assertEqual(resp.raw.tell(), 0)
+
+    def test_parsing_up_to_the_cap_keeps_memory_bounded(self):
+        deadline = self.fetcher.deadline()
+        tracemalloc.start()
+        try:
+            with self.fetcher.request(f"{self.base_url}/", deadline, stream=True) as resp:
+                page = PageMetadataParser("https://nosnocabo.com")
+                for text in self.fetcher.iter_text(resp, deadline, MAX_HTML_BYTES):
+                    page.feed(text)
+                page.close()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertFalse(page.has_webring_link)
+        self.assertLess(peak, MAX_HTML_BYTES // 4)
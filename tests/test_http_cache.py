@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from app.models.database import db
+from app.models.keyword import Keyword
+from app.models.website import Website
+from app.services.shortener import URLShortenerService
+from app.services.website import WebsiteService
+from tests.base import DatabaseTestCase
+
+
+def add_website(index: int, updated_at: datetime) -> Website:
+    keyword = Keyword(name=f"keyword-{index}", createdAt=updated_at.isoformat(), updatedAt=updated_at.isoformat())
+    website = Website(
+        name=f"Site {index}",
+        url=f"https://site-{index}.example.com",
+        description="",
+        color="#000000",
+        faviconUrl="",
+        createdAt=updated_at.isoformat(),
+        updatedAt=updated_at.isoformat(),
+        keywords=[keyword],
+    )
+    db.session.add(website)
+    db.session.commit()
+    return website
+
+
+class ConditionalGetTest(DatabaseTestCase):
+    def etag(self, path: str) -> str:
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response.headers["ETag"]
+
+    def test_deleting_an_older_website_changes_the_etag(self):
+        now = datetime.utcnow()
+        older = add_website(1, now - timedelta(days=1))
+        add_website(2, now)
+        etag = self.etag("/websites?limit=10")
+
+        self.assertEqual(self.client.get("/websites?limit=10", headers={"If-None-Match": etag}).status_code, 304)
+
+        WebsiteService(URLShortenerService()).delete_website_by_id(older.id)
+
+        self.assertNotEqual(self.etag("/websites?limit=10"), etag)
+
+    def test_unchanged_list_is_answered_from_one_validator_query(self):
+        URLShortenerService().create_mapping("https://example.com/")
+        etag = self.etag("/shorteners?limit=10")
+
+        statements = self.count_statements(
+            lambda: self.assertEqual(self.client.get("/shorteners?limit=10", headers={"If-None-Match": etag}).status_code, 304)
+        )
+
+        self.assertEqual(statements, 1)
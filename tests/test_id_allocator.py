@@ -0,0 +1,49 @@
+import json
+import os
+
+from sqlalchemy import text
+
+from app.models.database import db
+from app.models.URL_mapping import URLMapping
+from app.services.id_allocator import IdBlockAllocator
+from tests.base import DatabaseTestCase
+
+
+class IdBlockAllocatorTest(DatabaseTestCase):
+    def allocator(self) -> IdBlockAllocator:
+        return IdBlockAllocator(URLMapping.__tablename__, block_size=5)
+
+    def test_ids_come_from_the_table_sequence(self):
+        ids = self.allocator().allocate(3)
+
+        next_id = db.session.execute(text("SELECT nextval(pg_get_serial_sequence('url_mappings', 'id'))")).scalar()
+        self.assertEqual(len(set(ids)), 3)
+        # The whole block was reserved, so the sequence is past it.
+        self.assertEqual(next_id, ids[0] + 5)
+
+    def test_allocators_never_hand_out_the_same_id(self):
+        first, second = self.allocator(), self.allocator()
+
+        ids = first.allocate(3) + second.allocate(7) + first.allocate(4) + second.allocate(1)
+
+        self.assertEqual(len(set(ids)), 15)
+
+    def test_forked_worker_reserves_its_own_block(self):
+        allocator = self.allocator()
+        parent_ids = allocator.allocate(1)
+        read_end, write_end = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            # What gunicorn's post_fork does before the worker serves requests.
+            db.engine.dispose(close=False)
+            os.write(write_end, json.dumps(allocator.allocate(2)).encode())
+            os._exit(0)
+
+        os.close(write_end)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_end) as pipe:
+            child_ids = json.load(pipe)
+
+        ids = parent_ids + child_ids + allocator.allocate(4)
+        self.assertEqual(len(set(ids)), 7)
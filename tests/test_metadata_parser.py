@@ -0,0 +1,37 @@
+import unittest
+
+from app.lib.metadata_parser import PageMetadataParser
+from benchmarks.metadata_parser import (
+    WEBRING_URL,
+    padded,
+    parser_metadata,
+    sample_pages,
+    soup_metadata,
+)
+
+
+class MetadataParserEquivalenceTest(unittest.TestCase):
+    def test_sample_pages_match_the_beautifulsoup_helpers(self):
+        for name, html in sample_pages().items():
+            with self.subTest(page=name):
+                self.assertEqual(parser_metadata(html), soup_metadata(html))
+
+    def test_webring_link_after_a_long_body_matches(self):
+        for name, html in sample_pages().items():
+            with self.subTest(page=name):
+                html = padded(html, 64)
+                self.assertEqual(parser_metadata(html), soup_metadata(html))
+
+    def test_streamed_chunks_give_the_same_page(self):
+        for name, html in sample_pages().items():
+            with self.subTest(page=name):
+                whole = PageMetadataParser(WEBRING_URL)
+                whole.feed(html)
+                whole.close()
+
+                streamed = PageMetadataParser(WEBRING_URL)
+                for start in range(0, len(html), 7):
+                    streamed.feed(html[start:start + 7])
+                streamed.close()
+
+                self.assertEqual(streamed.to_dict(), whole.to_dict())
@@ -0,0 +1,28 @@
+from app.lib.pagination import encode_cursor
+from tests.base import DatabaseTestCase
+
+
+class CursorTypeTest(DatabaseTestCase):
+    def get_page(self, path: str, cursor, **params):
+        return self.client.get(path, query_string={"after": encode_cursor(cursor), **params})
+
+    def test_cursor_of_another_type_than_the_key_is_rejected(self):
+        cases = [
+            ("/websites", "abc", {}),
+            ("/shorteners", "abc", {}),
+            ("/shorteners/analytics", 5, {}),
+            ("/websites/search", [0.5, "abc"], {"q": "webring"}),
+        ]
+        for path, cursor, params in cases:
+            with self.subTest(path=path, cursor=cursor):
+                self.assertEqual(self.get_page(path, cursor, **params).status_code, 400)
+
+    def test_cursor_of_the_key_type_is_accepted(self):
+        cases = [
+            ("/websites", 1, {}),
+            ("/shorteners/analytics", "b", {}),
+            ("/websites/search", [0.5, 1], {"q": "webring"}),
+        ]
+        for path, cursor, params in cases:
+            with self.subTest(path=path, cursor=cursor):
+                self.assertEqual(self.get_page(path, cursor, **params).status_code, 200)
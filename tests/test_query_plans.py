@@ -0,0 +1,9 @@
+from app.services.query_plans import check_query_plans
+from tests.base import DatabaseTestCase
+
+
+class QueryPlansTest(DatabaseTestCase):
+    def test_hot_queries_use_indexes(self):
+        for name, scans in check_query_plans().items():
+            with self.subTest(query=name):
+                self.assertEqual(scans, [])
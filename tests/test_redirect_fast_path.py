@@ -0,0 +1,59 @@
+from unittest import mock
+
+from app import create_app
+from app.services.shortener import URLShortenerService, mapping_cache
+from tests.base import DatabaseTestCase
+
+ORIGINAL_URL = "https://exemplo.com.br/ação?q=a b&tag=<x>"
+
+with mock.patch("app.REDIRECT_FAST_PATH", True), mock.patch("app.BUFFER_CLICKS", True):
+    fast_app = create_app()
+
+
+class RedirectFastPathTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.fast_client = fast_app.test_client()
+        self.short_url = URLShortenerService().create_mapping(ORIGINAL_URL).short_url
+        self.path = f"/nos/{self.short_url}"
+
+    def test_cached_redirect_matches_flask(self):
+        for method in ("get", "head"):
+            with self.subTest(method=method):
+                expected = getattr(self.client, method)(self.path)
+                with mock.patch.object(fast_app, "full_dispatch_request", side_effect=AssertionError("Flask foi chamado")):
+                    response = getattr(self.fast_client, method)(self.path)
+
+                self.assertEqual(response.status, expected.status)
+                self.assertEqual(response.headers["Location"], expected.headers["Location"])
+                self.assertEqual(response.data, expected.data)
+                self.assertEqual(response.headers["Content-Type"], expected.headers["Content-Type"])
+                self.assertEqual(
+                    response.headers["Access-Control-Allow-Origin"], expected.headers["Access-Control-Allow-Origin"]
+                )
+
+    def test_cache_miss_falls_through_to_flask(self):
+        mapping_cache.clear()
+
+        with mock.patch.object(fast_app, "full_dispatch_request", wraps=fast_app.full_dispatch_request) as dispatch:
+            response = self.fast_client.get(self.path)
+            self.assertEqual(dispatch.call_count, 1)
+
+            # Flask's lookup cached the mapping, so the next redirect skips it.
+            self.fast_client.get(self.path)
+            self.assertEqual(dispatch.call_count, 1)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers["Location"], self.client.get(self.path).headers["Location"])
+
+    def test_unknown_codes_and_cross_origin_requests_fall_through(self):
+        self.client.get(self.path)
+
+        with mock.patch.object(fast_app, "full_dispatch_request", wraps=fast_app.full_dispatch_request) as dispatch:
+            unknown = self.fast_client.get("/nos/zzzzzz")
+            cross_origin = self.fast_client.get(self.path, headers={"Origin": "https://outro.example.com"})
+
+        self.assertEqual(dispatch.call_count, 2)
+        self.assertEqual(unknown.status_code, 404)
+        self.assertEqual(cross_origin.status_code, 302)
+        self.assertEqual(cross_origin.headers["Access-Control-Allow-Origin"], "https://outro.example.com")
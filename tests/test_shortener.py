@@ -0,0 +1,117 @@
+from unittest import mock
+
+from app.lib.url_fingerprint import url_fingerprint
+from app.models.database import db
+from app.models.URL_mapping import URLMapping
+from app.services.shortener import URLShortenerService
+from tests.base import DatabaseTestCase
+
+
+class CreateMappingsTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.service = URLShortenerService()
+
+    def test_shortening_twice_returns_the_same_code(self):
+        first = self.service.create_mapping("https://example.com/artigo")
+
+        [(again, created)] = self.service.create_mappings(["https://example.com/artigo"])
+
+        self.assertFalse(created)
+        self.assertEqual(again.short_url, first.short_url)
+        self.assertEqual(URLMapping.query.count(), 1)
+
+    def test_equivalent_urls_share_a_mapping(self):
+        urls = [
+            "https://example.com",
+            "HTTPS://Example.COM/",
+            "https://example.com:443/",
+            " https://EXAMPLE.com ",
+        ]
+
+        results = self.service.create_mappings(urls)
+
+        self.assertEqual({mapping.short_url for mapping, _ in results}, {results[0][0].short_url})
+        self.assertEqual(URLMapping.query.count(), 1)
+        self.assertEqual(URLMapping.query.one().original_url, "https://example.com")
+
+        [(later, created)] = self.service.create_mappings(["https://EXAMPLE.com:443"])
+        self.assertFalse(created)
+        self.assertEqual(later.short_url, results[0][0].short_url)
+
+    def test_different_paths_and_ports_get_their_own_mappings(self):
+        urls = ["https://example.com/", "https://example.com/Sobre", "https://example.com:8443/", "http://example.com/"]
+
+        results = self.service.create_mappings(urls)
+
+        self.assertEqual(len({mapping.short_url for mapping, _ in results}), 4)
+        self.assertEqual(URLMapping.query.count(), 4)
+
+    def test_concurrent_insert_wins_and_its_mapping_is_returned(self):
+        url = "https://example.com/concorrente"
+        [url_id] = self.service.ids.allocate(1)
+        find_by_fingerprints = self.service._find_by_fingerprints
+        lookups = []
+
+        def find_after_competitor(fingerprints):
+            lookups.append(fingerprints)
+            if len(lookups) > 1:
+                return find_by_fingerprints(fingerprints)
+            # Another request shortens the URL between the lookup and the insert.
+            with db.engine.begin() as connection:
+                connection.execute(URLMapping.__table__.insert().values(
+                    id=url_id,
+                    short_url="concorre",
+                    original_url=url,
+                    url_fingerprint=url_fingerprint(url),
+                    created_at=db.func.now(),
+                ))
+            return {}
+
+        with mock.patch.object(self.service, "_find_by_fingerprints", side_effect=find_after_competitor):
+            results = self.service.create_mappings([url, "https://example.com/nova", url])
+
+        (first, first_created), (new, new_created), (second, second_created) = results
+        self.assertEqual((first.short_url, first_created), ("concorre", False))
+        self.assertEqual((second.short_url, second_created), ("concorre", False))
+        self.assertTrue(new_created)
+        self.assertEqual(lookups[1], {url_fingerprint(url)})
+        self.assertEqual(URLMapping.query.count(), 2)
+        self.assertEqual(self.service.cached_original_url("concorre"), url)
+
+
+class ShortenBulkTest(DatabaseTestCase):
+    def test_mixed_batch_keeps_order_and_inserts_once(self):
+        existing = URLShortenerService().create_mapping("https://example.com/antiga")
+        urls = [
+            "https://example.com/nova-1",
+            "não é uma url",
+            "https://example.com/antiga",
+            "https://EXAMPLE.com:443/nova-1",
+            "https://example.com/nova-2",
+            "ftp//quebrada",
+        ]
+        responses = []
+
+        statements = self.record_statements(lambda: responses.append(self.client.post("/shorten/bulk", json={"urls": urls})))
+
+        response = responses[0]
+        self.assertEqual(response.status_code, 200)
+        items = response.json["items"]
+        self.assertEqual([item["url"] for item in items], urls)
+        self.assertEqual(
+            [item["status"] for item in items],
+            ["created", "invalid", "existing", "duplicate", "created", "invalid"],
+        )
+        self.assertEqual(items[2]["short_url"], existing.short_url)
+        self.assertIn("posição 0", items[3]["error"])
+        self.assertIsNone(items[3]["short_url"])
+        self.assertNotEqual(items[0]["short_url"], items[4]["short_url"])
+        self.assertEqual(
+            (response.json["created"], response.json["existing"], response.json["failed"]),
+            (2, 1, 3),
+        )
+
+        inserts = [statement for statement in statements if statement.startswith("INSERT INTO url_mappings")]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(URLMapping.query.count(), 3)
@@ -0,0 +1,26 @@
+from tests.base import DatabaseTestCase
+
+
+class SnapshotResponseTest(DatabaseTestCase):
+    def test_gzip_and_identity_bodies_have_different_etags(self):
+        identity = self.client.get("/keywords/", headers={"Accept-Encoding": "identity"})
+        gzipped = self.client.get("/keywords/", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(gzipped.headers["Content-Encoding"], "gzip")
+        self.assertNotEqual(identity.headers["ETag"], gzipped.headers["ETag"])
+
+        for response, encoding in [(identity, "identity"), (gzipped, "gzip")]:
+            with self.subTest(encoding=encoding):
+                revalidated = self.client.get(
+                    "/keywords/",
+                    headers={"Accept-Encoding": encoding, "If-None-Match": response.headers["ETag"]},
+                )
+                self.assertEqual(revalidated.status_code, 304)
+
+    def test_etag_of_one_coding_does_not_validate_the_other(self):
+        identity = self.client.get("/keywords/", headers={"Accept-Encoding": "identity"})
+        response = self.client.get(
+            "/keywords/", headers={"Accept-Encoding": "gzip", "If-None-Match": identity.headers["ETag"]}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from app.models.database import db
+from app.models.keyword import Keyword
+from app.models.website import Website
+from app.services.website import webring_snapshots
+from tests.base import DatabaseTestCase
+
+
+class WebsiteListQueriesTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        now = datetime.utcnow().isoformat()
+        self.keywords = [Keyword(name=f"keyword-{index}", createdAt=now, updatedAt=now) for index in range(3)]
+        self.website_count = 0
+
+    def add_websites(self, count: int) -> None:
+        now = datetime.utcnow().isoformat()
+        for index in range(self.website_count, self.website_count + count):
+            db.session.add(Website(
+                name=f"Site {index}",
+                url=f"https://site-{index}.example.com",
+                description="",
+                color="#000000",
+                faviconUrl="",
+                createdAt=now,
+                updatedAt=now,
+                keywords=self.keywords[: index % 3 + 1],
+            ))
+        db.session.commit()
+        self.website_count += count
+
+    def list_statements(self, path: str) -> int:
+        # The unpaginated list is served from a snapshot; drop it so the request queries again.
+        webring_snapshots.invalidate()
+
+        def request():
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.get_json())
+
+        return self.count_statements(request)
+
+    def assert_constant_statements(self, path: str) -> None:
+        self.add_websites(1)
+        one = self.list_statements(path)
+        self.add_websites(29)
+        self.assertEqual(self.list_statements(path), one)
+
+    def test_list_runs_the_same_statements_for_any_number_of_websites(self):
+        self.assert_constant_statements("/websites")
+
+    def test_page_runs_the_same_statements_for_any_number_of_websites(self):
+        self.assert_constant_statements("/websites?limit=50")